@@ -40,7 +40,7 @@ class LocationManager:
             try:
                 self.timezone = pytz.timezone(timezone_name)
             except pytz.UnknownTimeZoneError:
-                logger.warning(f"Unknown timezone '{timezone_name}', using UTC")
+                logger.warning("Unknown timezone '%s', using UTC", timezone_name)
                 self.timezone = pytz.UTC
         else:
             # Try to guess timezone from coordinates
@@ -55,9 +55,12 @@ class LocationManager:
                 lat=latitude, lon=longitude, height=self.elevation
             )
             logger.info(
-                f"Telescope location set to: {latitude:.4f}°, {longitude:.4f}°, {self.elevation}m"
+                "Telescope location set to: %.4f°, %.4f°, %sm",
+                latitude,
+                longitude,
+                self.elevation,
             )
-            logger.info(f"Timezone: {self.timezone}")
+            logger.info("Timezone: %s", self.timezone)
 
     def _guess_timezone(self) -> pytz.BaseTzInfo:
         """Guess timezone from coordinates."""
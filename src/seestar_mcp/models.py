@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TelescopeStatus(str, Enum):
@@ -43,6 +43,8 @@ class CalibrationStatus(str, Enum):
 class Coordinates(BaseModel):
     """Celestial coordinates."""
 
+    model_config = ConfigDict(frozen=True)
+
     ra: float = Field(..., description="Right ascension in hours")
     dec: float = Field(..., description="Declination in degrees")
     epoch: str = Field(default="J2000", description="Coordinate epoch")
@@ -51,6 +53,8 @@ class Coordinates(BaseModel):
 class Target(BaseModel):
     """Target object information."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Target name")
     coordinates: Coordinates = Field(..., description="Target coordinates")
     magnitude: Optional[float] = Field(None, description="Target magnitude")
@@ -72,6 +76,8 @@ class TelescopeInfo(BaseModel):
 class TelescopeState(BaseModel):
     """Current telescope state."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: TelescopeStatus = Field(..., description="Current telescope status")
     connected: bool = Field(..., description="Connection status")
     ra: Optional[float] = Field(None, description="Current RA position in hours")
@@ -81,8 +87,9 @@ class TelescopeState(BaseModel):
     is_tracking: bool = Field(default=False, description="Tracking status")
     is_parked: bool = Field(default=False, description="Park status")
     current_target: Optional[str] = Field(None, description="Current target name")
-    last_updated: datetime = Field(
-        default_factory=datetime.now, description="Last update time"
+    last_updated: Optional[datetime] = Field(
+        default_factory=datetime.now,
+        description="Last update time (None when no position data is available)",
     )
 
 
@@ -102,6 +109,8 @@ class ImagingParams(BaseModel):
 class ImagingState(BaseModel):
     """Current imaging state."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: ImagingStatus = Field(..., description="Imaging status")
     progress: int = Field(default=0, ge=0, le=100, description="Progress percentage")
     current_image: int = Field(default=0, ge=0, description="Current image number")
@@ -118,6 +127,8 @@ class ImagingState(BaseModel):
 class CalibrationState(BaseModel):
     """Current calibration state."""
 
+    model_config = ConfigDict(frozen=True)
+
     status: CalibrationStatus = Field(..., description="Calibration status")
     progress: int = Field(default=0, ge=0, le=100, description="Progress percentage")
     current_step: Optional[str] = Field(None, description="Current calibration step")
@@ -129,6 +140,8 @@ class CalibrationState(BaseModel):
 class ConnectionParams(BaseModel):
     """Telescope connection parameters."""
 
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field(..., description="Telescope IP address")
     port: int = Field(default=4700, ge=1, le=65535, description="Telescope port")
     timeout: float = Field(
@@ -25,6 +25,11 @@ from .models import (
 from .target_resolver import TargetResolver, format_coordinates
 from .telescope_client import SeestarClient
 
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None  # type: ignore[assignment]
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -72,16 +77,18 @@ def create_server() -> FastMCP:
         _last_command_time = datetime.now()
 
         if ctx:
-            await ctx.info(f"Connecting to telescope at {host}:{port}")
+            await ctx.info(f"Connecting to telescope at {host}:{port}")  # noqa: G004
 
         try:
-            # Close existing connection if any
-            if _telescope_client:
+            # Reuse the shared client for this telescope
+            client = await SeestarClient.get(host, port, timeout)
+
+            # Close existing connection to a different telescope if any
+            if _telescope_client and _telescope_client is not client:
                 await _telescope_client.disconnect()
 
-            # Create new client and connect
-            _telescope_client = SeestarClient(host, port, timeout)
-            success = await _telescope_client.connect()
+            _telescope_client = client
+            success = client.is_connected or await client.connect()
 
             if success:
                 state = await _telescope_client.get_status()
@@ -203,7 +210,7 @@ def create_server() -> FastMCP:
             raise ToolError("Not connected to telescope. Use connect_telescope first.")
 
         if ctx:
-            await ctx.info(f"Resolving target: {target_name}")
+            await ctx.info(f"Resolving target: {target_name}")  # noqa: G004
             await ctx.report_progress(10, 100)
 
         try:
@@ -232,7 +239,9 @@ def create_server() -> FastMCP:
 
             if ctx:
                 coord_str = format_coordinates(target.coordinates)
-                await ctx.info(f"Target found: {target.name} at {coord_str}")
+                await ctx.info(
+                    f"Target found: {target.name} at {coord_str}"  # noqa: G004
+                )
                 await ctx.report_progress(60, 100)
 
             # Slew to target
@@ -248,7 +257,7 @@ def create_server() -> FastMCP:
                 if is_solar_target:
                     if ctx:
                         await ctx.info(
-                            f"⚠️  SOLAR OBSERVATION: Using specialized solar mode for {target.name}"
+                            f"⚠️  SOLAR OBSERVATION: Using specialized solar mode for {target.name}"  # noqa: G004
                         )
                         await ctx.info(
                             "Ensure proper solar filter is installed before observation!"
@@ -284,20 +293,22 @@ def create_server() -> FastMCP:
                 # Get updated status
                 state = await _telescope_client.get_status()
                 if state:
-                    state.current_target = target.name
+                    state = state.model_copy(update={"current_target": target.name})
 
                 if ctx:
                     await ctx.report_progress(100, 100)
 
                     if is_solar_target:
                         await ctx.info(
-                            f"Successfully started solar observation mode for {target.name}"
+                            f"Successfully started solar observation mode for {target.name}"  # noqa: G004
                         )
                         await ctx.info(
                             "⚠️  Telescope should now be pointing to Sun - verify solar filter is installed!"
                         )
                     else:
-                        await ctx.info(f"Successfully slewing to {target.name}")
+                        await ctx.info(
+                            f"Successfully slewing to {target.name}"  # noqa: G004
+                        )
 
                 # Different message for solar vs regular targets
                 message = (
@@ -356,7 +367,9 @@ def create_server() -> FastMCP:
             raise ToolError("Not connected to telescope. Use connect_telescope first.")
 
         if ctx:
-            await ctx.info(f"Starting imaging: {count} images x {exposure_time}s")
+            await ctx.info(
+                f"Starting imaging: {count} images x {exposure_time}s"  # noqa: G004
+            )
 
         try:
             params = ImagingParams(
@@ -523,7 +536,7 @@ def create_server() -> FastMCP:
 
         if ctx:
             await ctx.info(
-                f"Starting mosaic imaging of {target_name} ({mosaic_width}x{mosaic_height})"
+                f"Starting mosaic imaging of {target_name} ({mosaic_width}x{mosaic_height})"  # noqa: G004
             )
             await ctx.report_progress(20, 100)
 
@@ -553,7 +566,9 @@ def create_server() -> FastMCP:
 
             if ctx:
                 coord_str = format_coordinates(target.coordinates)
-                await ctx.info(f"Target found: {target.name} at {coord_str}")
+                await ctx.info(
+                    f"Target found: {target.name} at {coord_str}"  # noqa: G004
+                )
                 await ctx.report_progress(60, 100)
 
             # Prepare mosaic parameters
@@ -597,13 +612,17 @@ def create_server() -> FastMCP:
                     # Get updated status
                     state = await _telescope_client.get_status()
                     if state:
-                        state.current_target = (
-                            f"{target.name} (Mosaic {mosaic_width}x{mosaic_height})"
+                        state = state.model_copy(
+                            update={
+                                "current_target": f"{target.name} (Mosaic {mosaic_width}x{mosaic_height})"
+                            }
                         )
 
                     if ctx:
                         await ctx.report_progress(100, 100)
-                        await ctx.info(f"Started mosaic imaging of {target.name}")
+                        await ctx.info(
+                            f"Started mosaic imaging of {target.name}"  # noqa: G004
+                        )
 
                     return TelescopeResponse(
                         success=True,
@@ -839,8 +858,13 @@ def create_server() -> FastMCP:
                 if ctx:
                     await ctx.info(message)
 
+                # The client returns a shared read-only mapping; the response
+                # model takes its own dict copy
                 return TelescopeResponse(
-                    success=True, message=message, telescope_state=state, data=result
+                    success=True,
+                    message=message,
+                    telescope_state=state,
+                    data=dict(result),
                 )
             else:
                 error = result.get("error", "Unknown error")
@@ -992,7 +1016,7 @@ def create_server() -> FastMCP:
                 )
 
             if ctx:
-                await ctx.info(f"Solar safety check complete: {status}")
+                await ctx.info(f"Solar safety check complete: {status}")  # noqa: G004
                 if is_visible:
                     await ctx.warning(
                         "Solar filter verification required before observation!"
@@ -1030,7 +1054,7 @@ def create_server() -> FastMCP:
         _last_command_time = datetime.now()
 
         if ctx:
-            await ctx.info(f"Searching for target: {target_name}")
+            await ctx.info(f"Searching for target: {target_name}")  # noqa: G004
 
         try:
             # Initialize target resolver if needed
@@ -1041,9 +1065,11 @@ def create_server() -> FastMCP:
 
             if result.found and result.target is not None and ctx:
                 coord_str = format_coordinates(result.target.coordinates)
-                await ctx.info(f"Found: {result.target.name} at {coord_str}")
+                await ctx.info(
+                    f"Found: {result.target.name} at {coord_str}"  # noqa: G004
+                )
             elif not result.found and ctx:
-                await ctx.warning(f"Target '{target_name}' not found")
+                await ctx.warning(f"Target '{target_name}' not found")  # noqa: G004
 
             return result
 
@@ -1185,12 +1211,17 @@ def main() -> None:
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    # Run every event loop (the server's and the auto-connect thread's) on
+    # uvloop where it is available
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     # Create server
     mcp = create_server()
 
     # Auto-connect if host provided (run in background)
     if args.host:
-        logger.info(f"Auto-connecting to telescope at {args.host}:{args.port}")
+        logger.info("Auto-connecting to telescope at %s:%s", args.host, args.port)
 
         def auto_connect_background() -> None:
             import asyncio
@@ -1199,7 +1230,7 @@ def main() -> None:
             async def connect() -> None:
                 global _telescope_client
                 try:
-                    _telescope_client = SeestarClient(
+                    _telescope_client = await SeestarClient.get(
                         args.host, args.port, args.timeout
                     )
                     success = await _telescope_client.connect()
@@ -1208,14 +1239,14 @@ def main() -> None:
                     else:
                         logger.warning("Auto-connection failed")
                 except Exception as e:
-                    logger.warning(f"Auto-connection error: {e}")
+                    logger.warning("Auto-connection error: %s", e)
 
             # Run connection in a separate thread
             def run_connect() -> None:
                 try:
                     asyncio.run(connect())
                 except Exception as e:
-                    logger.warning(f"Background connection error: {e}")
+                    logger.warning("Background connection error: %s", e)
 
             thread = threading.Thread(target=run_connect, daemon=True)
             thread.start()
@@ -1232,7 +1263,7 @@ def main() -> None:
         # Let FastMCP handle everything
         mcp.run()
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
 
 
@@ -1,8 +1,10 @@
 """Target resolution utilities for astronomical objects."""
 
 import asyncio
+import functools
 import logging
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 
 import httpx
@@ -15,26 +17,70 @@ from .models import Coordinates, Target, TargetSearchResult
 
 logger = logging.getLogger(__name__)
 
+# Common Messier to NGC mappings, built once rather than on every lookup
+_MESSIER_TO_NGC = MappingProxyType(
+    {
+        1: 1952,  # M1 = NGC 1952 (Crab Nebula)
+        31: 224,  # M31 = NGC 224 (Andromeda Galaxy)
+        42: 1976,  # M42 = NGC 1976 (Orion Nebula)
+        45: 1432,  # M45 = NGC 1432 (Pleiades)
+        51: 5194,  # M51 = NGC 5194 (Whirlpool Galaxy)
+        57: 6720,  # M57 = NGC 6720 (Ring Nebula)
+        81: 3031,  # M81 = NGC 3031 (Bode's Galaxy)
+        82: 3034,  # M82 = NGC 3034 (Cigar Galaxy)
+        101: 5457,  # M101 = NGC 5457 (Pinwheel Galaxy)
+        104: 4594,  # M104 = NGC 4594 (Sombrero Galaxy)
+    }
+)
+_NGC_TO_MESSIER = MappingProxyType({v: k for k, v in _MESSIER_TO_NGC.items()})
+
+_SIMBAD_TAP_URL = "http://simbad.cds.unistra.fr/simbad/sim-tap/sync"
+
+
+@functools.lru_cache(maxsize=512)
+def _build_simbad_url(target_name: str) -> str:
+    """Build the SIMBAD TAP query URL for a target, cached per name."""
+    query = f"""
+            SELECT TOP 1
+                main_id,
+                ra, dec,
+                otype_txt as object_type,
+                flux as magnitude
+            FROM basic
+            WHERE main_id = '{target_name}'
+               OR oid = '{target_name}'
+            """
+    return str(httpx.URL(_SIMBAD_TAP_URL, params={"query": query, "format": "json"}))
+
 
 class TargetResolver:
     """Resolves target names to coordinates using various astronomical catalogs."""
 
-    def __init__(self, location_manager: Optional[LocationManager] = None) -> None:
-        """Initialize the target resolver."""
-        self.session: Optional[httpx.AsyncClient] = None
+    def __init__(
+        self,
+        location_manager: Optional[LocationManager] = None,
+        session: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        """Initialize the target resolver.
+
+        A caller-provided session is used as is and left open on exit.
+        """
+        self.session: Optional[httpx.AsyncClient] = session
+        self._owns_session = session is None
         self._cache: Dict[str, Target] = {}
         self.location_manager = location_manager
 
     async def __aenter__(self) -> "TargetResolver":
         """Async context manager entry."""
-        self.session = httpx.AsyncClient(timeout=30.0)
+        if self._owns_session:
+            self.session = httpx.AsyncClient(timeout=30.0)
         return self
 
     async def __aexit__(
         self, exc_type: type, exc_val: Exception, exc_tb: object
     ) -> None:
         """Async context manager exit."""
-        if self.session:
+        if self._owns_session and self.session:
             await self.session.aclose()
 
     async def resolve_target(self, target_name: str) -> TargetSearchResult:
@@ -48,11 +94,11 @@ class TargetResolver:
             TargetSearchResult with target information or alternatives
         """
         target_name = target_name.strip()
-        logger.info(f"Resolving target: {target_name}")
+        logger.info("Resolving target: %s", target_name)
 
         # Check cache first
         if target_name.lower() in self._cache:
-            logger.debug(f"Found {target_name} in cache")
+            logger.debug("Found %s in cache", target_name)
             return TargetSearchResult(
                 found=True,
                 target=self._cache[target_name.lower()],
@@ -70,7 +116,7 @@ class TargetResolver:
                 )
 
         except Exception as e:
-            logger.warning(f"Solar system resolution failed for {target_name}: {e}")
+            logger.warning("Solar system resolution failed for %s: %s", target_name, e)
 
         try:
             # Method 2: Astropy name resolution (SIMBAD, NED)
@@ -82,7 +128,7 @@ class TargetResolver:
                 )
 
         except Exception as e:
-            logger.warning(f"Astropy resolution failed for {target_name}: {e}")
+            logger.warning("Astropy resolution failed for %s: %s", target_name, e)
 
         try:
             # Method 3: SIMBAD direct query
@@ -94,7 +140,7 @@ class TargetResolver:
                 )
 
         except Exception as e:
-            logger.warning(f"SIMBAD resolution failed for {target_name}: {e}")
+            logger.warning("SIMBAD resolution failed for %s: %s", target_name, e)
 
         # Method 4: Try common name variations
         alternatives = await self._find_alternatives(target_name)
@@ -110,7 +156,7 @@ class TargetResolver:
         """Resolve target using Astropy's coordinate resolution."""
         try:
             # Run in thread to avoid blocking
-            coord = await asyncio.get_event_loop().run_in_executor(
+            coord = await asyncio.get_running_loop().run_in_executor(
                 None, lambda: get_icrs_coordinates(target_name)
             )
 
@@ -129,7 +175,7 @@ class TargetResolver:
             return None
 
         except Exception as e:
-            logger.debug(f"Astropy resolution failed: {e}")
+            logger.debug("Astropy resolution failed: %s", e)
             return None
 
     async def _resolve_solar_system_object(self, target_name: str) -> Optional[Target]:
@@ -163,13 +209,13 @@ class TargetResolver:
 
             # Run in thread to avoid blocking
             if target_lower == "sun":
-                coord = await asyncio.get_event_loop().run_in_executor(
+                coord = await asyncio.get_running_loop().run_in_executor(
                     None, lambda: get_sun(astropy_time)
                 )
                 object_type = "Star"
                 magnitude = -26.7  # Apparent magnitude of Sun
             elif target_lower == "moon":
-                coord = await asyncio.get_event_loop().run_in_executor(
+                coord = await asyncio.get_running_loop().run_in_executor(
                     None, lambda: get_body("moon", astropy_time)
                 )
                 object_type = "Satellite"
@@ -177,7 +223,7 @@ class TargetResolver:
             else:
                 # For planets, use get_body
                 body_name = solar_system_objects[target_lower]
-                coord = await asyncio.get_event_loop().run_in_executor(
+                coord = await asyncio.get_running_loop().run_in_executor(
                     None, lambda: get_body(body_name, astropy_time)
                 )
                 object_type = "Planet"
@@ -215,7 +261,7 @@ class TargetResolver:
             return None
 
         except Exception as e:
-            logger.debug(f"Solar system object resolution failed: {e}")
+            logger.debug("Solar system object resolution failed: %s", e)
             return None
 
     async def _resolve_with_simbad(self, target_name: str) -> Optional[Target]:
@@ -224,23 +270,7 @@ class TargetResolver:
             return None
 
         try:
-            # SIMBAD TAP query
-            query = f"""
-            SELECT TOP 1
-                main_id,
-                ra, dec,
-                otype_txt as object_type,
-                flux as magnitude
-            FROM basic
-            WHERE main_id = '{target_name}'
-               OR oid = '{target_name}'
-            """
-
-            params = {"query": query, "format": "json"}
-
-            response = await self.session.get(
-                "http://simbad.cds.unistra.fr/simbad/sim-tap/sync", params=params
-            )
+            response = await self.session.get(_build_simbad_url(target_name))
 
             if response.status_code == 200:
                 data = response.json()
@@ -263,7 +293,7 @@ class TargetResolver:
             return None
 
         except Exception as e:
-            logger.debug(f"SIMBAD query failed: {e}")
+            logger.debug("SIMBAD query failed: %s", e)
             return None
 
     async def _find_alternatives(self, target_name: str) -> List[str]:
@@ -320,37 +350,11 @@ class TargetResolver:
 
     def _messier_to_ngc(self, messier_num: int) -> Optional[int]:
         """Convert Messier number to NGC number."""
-        # Common Messier to NGC mappings
-        messier_ngc_map = {
-            1: 1952,  # M1 = NGC 1952 (Crab Nebula)
-            31: 224,  # M31 = NGC 224 (Andromeda Galaxy)
-            42: 1976,  # M42 = NGC 1976 (Orion Nebula)
-            45: 1432,  # M45 = NGC 1432 (Pleiades)
-            51: 5194,  # M51 = NGC 5194 (Whirlpool Galaxy)
-            57: 6720,  # M57 = NGC 6720 (Ring Nebula)
-            81: 3031,  # M81 = NGC 3031 (Bode's Galaxy)
-            82: 3034,  # M82 = NGC 3034 (Cigar Galaxy)
-            101: 5457,  # M101 = NGC 5457 (Pinwheel Galaxy)
-            104: 4594,  # M104 = NGC 4594 (Sombrero Galaxy)
-        }
-        return messier_ngc_map.get(messier_num)
+        return _MESSIER_TO_NGC.get(messier_num)
 
     def _ngc_to_messier(self, ngc_num: int) -> Optional[int]:
         """Convert NGC number to Messier number."""
-        # Reverse lookup
-        ngc_messier_map = {
-            1952: 1,  # NGC 1952 = M1 (Crab Nebula)
-            224: 31,  # NGC 224 = M31 (Andromeda Galaxy)
-            1976: 42,  # NGC 1976 = M42 (Orion Nebula)
-            1432: 45,  # NGC 1432 = M45 (Pleiades)
-            5194: 51,  # NGC 5194 = M51 (Whirlpool Galaxy)
-            6720: 57,  # NGC 6720 = M57 (Ring Nebula)
-            3031: 81,  # NGC 3031 = M81 (Bode's Galaxy)
-            3034: 82,  # NGC 3034 = M82 (Cigar Galaxy)
-            5457: 101,  # NGC 5457 = M101 (Pinwheel Galaxy)
-            4594: 104,  # NGC 4594 = M104 (Sombrero Galaxy)
-        }
-        return ngc_messier_map.get(ngc_num)
+        return _NGC_TO_MESSIER.get(ngc_num)
 
     def get_cached_targets(self) -> List[str]:
         """Get list of cached target names."""
@@ -408,11 +412,11 @@ class TargetResolver:
             else:
                 status = f"Target is below horizon at {altitude:.1f}° altitude (minimum {min_altitude}°)"
 
-            logger.info(f"Visibility check: {status}")
+            logger.info("Visibility check: %s", status)
             return is_visible, altitude, status
 
         except Exception as e:
-            logger.error(f"Error checking target visibility: {e}")
+            logger.error("Error checking target visibility: %s", e)
             return True, 0.0, f"Visibility check failed: {e}"
 
 
@@ -438,9 +442,11 @@ def degrees_to_dms(degrees: float) -> Tuple[int, int, float]:
 def format_coordinates(coordinates: Coordinates) -> str:
     """Format coordinates as human-readable string."""
     ra_h, ra_m, ra_s = hours_to_hms(coordinates.ra)
-    dec_d, dec_m, dec_s = degrees_to_dms(coordinates.dec)
+    # Sign taken from the declination itself so -0.x degrees keeps its minus
+    dec_sign = "-" if coordinates.dec < 0 else "+"
+    dec_d, dec_m, dec_s = degrees_to_dms(abs(coordinates.dec))
 
     return (
         f"RA: {ra_h:02d}h {ra_m:02d}m {ra_s:05.2f}s, "
-        f"DEC: {dec_d:+03d}° {dec_m:02d}' {dec_s:05.2f}\""
+        f"DEC: {dec_sign}{dec_d:02d}° {dec_m:02d}' {dec_s:05.2f}\""
     )
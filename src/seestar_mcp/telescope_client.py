@@ -1,13 +1,33 @@
 """TCP client for communicating with SeestarS50 telescope."""
 
 import asyncio
-import json
+import contextlib
+import functools
+import itertools
 import logging
+import re
 import socket
-import threading
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from threading import Event, Lock, Thread
+from types import MappingProxyType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    ParamSpec,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import orjson
 
 from .location_manager import LocationManager
 from .models import (
@@ -24,6 +44,134 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Shared clients keyed by (host, port). The SeestarS50 only accepts a single
+# control session, so every caller talking to the same telescope must reuse
+# one client instead of racing a second TCP connection against it.
+_clients: Dict[Tuple[str, int], "SeestarClient"] = {}
+_clients_lock = Lock()
+
+# Kernel socket buffer sizes for the telescope TCP connection
+_TCP_RCVBUF_SIZE = 1 << 20  # 1 MiB for bursty status/event frames
+_TCP_SNDBUF_SIZE = 1 << 18  # 256 KiB
+
+# Solar system targets that need special handling, matched as whole words
+_SOLAR = frozenset(
+    {
+        "sun",
+        "solar",
+        "sol",
+        "mercury",
+        "venus",
+        "mars",
+        "jupiter",
+        "saturn",
+        "uranus",
+        "neptune",
+    }
+)
+_SOLAR_RE = re.compile(r"\b(" + "|".join(sorted(_SOLAR)) + r")\b", re.IGNORECASE)
+
+# Sensor keys requested when checking arm position. Kept as a tuple so the
+# params stay hashable for _encode_tail(); orjson encodes it as a list.
+_SENSOR_KEYS = ("balance_sensor", "compass_sensor")
+
+# Events the telescope sends when a focuser or filter wheel move finishes
+_FOCUSER_MOVE_EVENT = "FocuserMove"
+_WHEEL_MOVE_EVENT = "WheelMove"
+_MOVE_EVENTS = frozenset({_FOCUSER_MOVE_EVENT, _WHEEL_MOVE_EVENT})
+
+# Seconds to wait for a move completion event, the fixed delay moves used to
+# take. Not every firmware is known to send these events, so a move without
+# one counts as sent, not failed
+_MOVE_EVENT_TIMEOUT = 2.0
+
+# Results that never vary, shared read-only instead of rebuilt on every call
+_OK_DEVICE_STATE_REQUESTED = MappingProxyType(
+    {"message": "Device state requested", "success": True}
+)
+_OK_UNPARKED = MappingProxyType(
+    {
+        "message": "Telescope arm opening sequence completed using scope_move_to_horizon",
+        "success": True,
+    }
+)
+_DEVICE_STATE = MappingProxyType({"status": "available", "connection": "connected"})
+_STATION_STATE = MappingProxyType({"mode": "station", "connected": True})
+_VIEW_STATE = MappingProxyType({"viewing": False, "target": None})
+_STACK_SETTING = MappingProxyType({"exposure": 10, "gain": 100, "count": 10})
+_WHEEL_STATE = MappingProxyType({"id": 0, "state": "idle", "unidirection": False})
+
+
+def _type_key(value: Any) -> Any:
+    """
+    Describe the types inside a param value for the _encode_tail() cache key.
+
+    Tuples are described element by element, so e.g. (True,) and (1,) get
+    different keys even though they compare equal.
+    """
+    if isinstance(value, tuple):
+        return (tuple, tuple(_type_key(item) for item in value))
+    return type(value)
+
+
+@functools.lru_cache(maxsize=64)
+def _encode_tail(method: str, params: Tuple[Tuple[str, Any, Any], ...]) -> bytes:
+    """
+    Encode everything after the command ID of a JSON command frame.
+
+    The (key, type key, value) triples keep e.g. False and 0 apart in the
+    cache, including inside tuples.
+    """
+    data: Dict[str, Any] = {"method": method}
+    if params:
+        data["params"] = {key: value for key, _, value in params}
+    return orjson.dumps(data)[1:]
+
+
+def _is_goto_failure(error: Any) -> bool:
+    """Check if an AutoGoto error reports a mount goto failure."""
+    return bool(error) and "goto failed" in str(error).lower()
+
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+# Marks _command_errors() users whose failures return an error dict
+_ERROR_RESULT: Any = object()
+
+
+def _command_errors(
+    action: str, default: Any = _ERROR_RESULT
+) -> Callable[[Callable[_P, Awaitable[_R]]], Callable[_P, Coroutine[Any, Any, _R]]]:
+    """
+    Log and swallow exceptions raised by a telescope command method.
+
+    Args:
+        action: What the method does, logged as "Failed to <action>: <error>"
+        default: Value returned on failure; without it the method returns
+            {"error": <message>, "success": False}
+
+    Returns:
+        Decorator for async SeestarClient methods
+    """
+
+    def decorator(
+        fn: Callable[_P, Awaitable[_R]],
+    ) -> Callable[_P, Coroutine[Any, Any, _R]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                logger.error("Failed to %s: %s", action, e)
+                if default is _ERROR_RESULT:
+                    return {"error": str(e), "success": False}  # type: ignore[return-value]
+                return default  # type: ignore[no-any-return]
+
+        return wrapper
+
+    return decorator
+
 
 class SeestarConnectionError(Exception):
     """Exception raised when telescope connection fails."""
@@ -57,73 +205,260 @@ class SeestarClient:
         self.socket: Optional[socket.socket] = None
         self._connected = False
         self._telescope_info: Optional[TelescopeInfo] = None
-        self._cmdid = 1000
+        # next() on itertools.count is atomic, so the message thread and the
+        # event loop can both draw IDs without a lock
+        self._cmdids = itertools.count(1001)
         self._is_watch_events = True
         self._op_state = "idle"
-        self._message_thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
+        self._message_thread: Optional[Thread] = None
+        # Stop token of the current connection's message thread
+        self._reader_stop: Optional[Event] = None
         self._last_heartbeat = time.time()
         self._last_error_details: Optional[Dict[str, Any]] = None
+        # Replies awaited by coroutines, keyed by command ID
+        self._pending: Dict[int, "asyncio.Future[Dict[str, Any]]"] = {}
+        # Focuser/filter wheel moves in progress, keyed by completion event name
+        self._move_waiters: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+    @classmethod
+    async def get(
+        cls,
+        host: str,
+        port: int = 4700,
+        timeout: float = 30.0,
+        location_manager: Optional[LocationManager] = None,
+    ) -> "SeestarClient":
+        """
+        Return the shared client for a telescope, creating it on first use.
+
+        Repeated calls with the same host and port return the same instance, so
+        an existing connection is reused rather than re-established. The shared
+        client takes the timeout of the latest call, and its location manager
+        when one is given.
+
+        Args:
+            host: Telescope IP address
+            port: Telescope port (default: 4700)
+            timeout: Request timeout in seconds
+            location_manager: Optional location manager for coordinate validation
+
+        Returns:
+            The shared SeestarClient for (host, port)
+        """
+        with _clients_lock:
+            client = _clients.get((host, port))
+            if client is None:
+                client = cls(host, port, timeout, location_manager)
+                _clients[(host, port)] = client
+            else:
+                client.timeout = timeout
+                if location_manager is not None:
+                    client.location_manager = location_manager
+            return client
 
     def _get_cmdid(self) -> int:
         """Get next command ID."""
-        with self._lock:
-            self._cmdid += 1
-            return self._cmdid
+        return next(self._cmdids)
 
-    def _send_message(self, data: str) -> None:
+    def _send_message(self, data: Union[str, bytes]) -> None:
         """Send message to telescope."""
         if not self.socket:
             raise RuntimeError("Not connected to telescope")
 
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
         try:
-            logger.info(f"SENDING: {data.strip()}")
-            self.socket.sendall(data.encode("utf-8"))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("SENDING: %s", data.strip().decode("utf-8"))
+            self.socket.sendall(data)
         except socket.error as e:
-            logger.error(f"Failed to send message: {e}")
+            logger.error("Failed to send message: %s", e)
             self._connected = False
             raise
 
-    def _receive_message(self) -> str:
+    def _receive_message(self) -> bytes:
         """Receive message from telescope."""
         if not self.socket:
             raise RuntimeError("Not connected to telescope")
 
         try:
-            data = self.socket.recv(1024 * 60)  # Large buffer for image data
-            return data.decode("utf-8")
+            return self.socket.recv(1024 * 60)  # Large buffer for image data
         except socket.error as e:
-            logger.error(f"Failed to receive message: {e}")
-            self._connected = False
+            logger.error("Failed to receive message: %s", e)
             raise
 
+    def _encode_command(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        expect_reply: bool = False,
+    ) -> Tuple[int, bytes]:
+        """
+        Build one JSON command frame, registering its reply future if asked.
+
+        With expect_reply, the reply must be awaited with _wait_for_response()
+        using the returned command ID, which must be called from a running
+        event loop.
+
+        Returns:
+            Tuple of (command ID, encoded JSON without the frame delimiter)
+        """
+        cmdid = self._get_cmdid()
+
+        if expect_reply:
+            self._pending[cmdid] = asyncio.get_running_loop().create_future()
+
+        # Repeated commands reuse their cached encoding; params with
+        # unhashable values (lists, nested dicts) are encoded every time
+        try:
+            items = tuple((k, _type_key(v), v) for k, v in (params or {}).items())
+            json_data = b'{"id":%d,' % cmdid + _encode_tail(method, items)
+        except TypeError:
+            data = {"id": cmdid, "method": method}
+            if params:
+                data["params"] = params
+            json_data = orjson.dumps(data)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("JSON COMMAND: %s -> %s", method, json_data.decode("utf-8"))
+        return cmdid, json_data
+
     def _json_message(
-        self, method: str, params: Optional[Dict[str, Any]] = None
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        expect_reply: bool = False,
+    ) -> int:
+        """
+        Send JSON message to telescope.
+
+        Args:
+            method: Command to send
+            params: Optional command parameters
+            expect_reply: Whether the caller awaits the reply with
+                _wait_for_response()
+
+        Returns:
+            Command ID of the sent message
+        """
+        return self._json_message_batch([(method, params)], expect_reply)[0]
+
+    def _json_message_batch(
+        self,
+        messages: List[Tuple[str, Optional[Dict[str, Any]]]],
+        expect_reply: bool = False,
+    ) -> List[int]:
+        """
+        Send several JSON messages to the telescope in a single write.
+
+        Args:
+            messages: (method, params) pairs, sent in order
+            expect_reply: Whether the caller awaits every message's reply
+                with _wait_for_response()
+
+        Returns:
+            Command IDs of the sent messages, in the same order
+        """
+        cmdids = []
+        frames = []
+        for method, params in messages:
+            cmdid, json_data = self._encode_command(method, params, expect_reply)
+            cmdids.append(cmdid)
+            frames.append(json_data + b"\r\n")
+
+        try:
+            self._send_message(b"".join(frames))
+        except Exception:
+            for cmdid in cmdids:
+                self._pending.pop(cmdid, None)
+            raise
+
+        return cmdids
+
+    async def _wait_for_response(
+        self, cmdid: int, timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Wait for the telescope's reply to a command.
+
+        Args:
+            cmdid: Command ID returned by _json_message(..., expect_reply=True)
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            The reply message, or None if it did not arrive in time
+        """
+        future = self._pending.get(cmdid)
+        if future is None:
+            return None
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.debug("No reply to command %s within %ss", cmdid, timeout)
+            return None
+        finally:
+            self._pending.pop(cmdid, None)
+
+    def _resolve_response(self, message: Dict[str, Any]) -> None:
+        """Hand a command reply from the message thread to its waiting coroutine."""
+        self._resolve(self._pending, message["id"], message)
+
+    def _resolve(
+        self,
+        waiters: Dict[Any, "asyncio.Future[Dict[str, Any]]"],
+        key: Any,
+        message: Dict[str, Any],
     ) -> None:
-        """Send JSON message to telescope."""
-        data = {"id": self._get_cmdid(), "method": method}
+        """Complete the future registered under key on its own event loop."""
+        future = waiters.get(key)
+        if future is None:
+            return
 
-        if params:
-            data["params"] = params
+        try:
+            future.get_loop().call_soon_threadsafe(
+                self._deliver, waiters, key, future, message
+            )
+        except RuntimeError:
+            # The event loop that is waiting has already closed
+            if waiters.get(key) is future:
+                waiters.pop(key, None)
+
+    @staticmethod
+    def _deliver(
+        waiters: Dict[Any, "asyncio.Future[Dict[str, Any]]"],
+        key: Any,
+        future: "asyncio.Future[Dict[str, Any]]",
+        message: Dict[str, Any],
+    ) -> None:
+        """Complete a waiting future (runs on the event loop)."""
+        if waiters.get(key) is future:
+            waiters.pop(key)
+        if not future.done():
+            future.set_result(message)
 
-        json_data = json.dumps(data)
-        logger.info(f"JSON COMMAND: {method} -> {json_data}")
-        self._send_message(json_data + "\r\n")
+    def _message_thread_fn(self, stop: Event) -> None:
+        """
+        Background thread to handle incoming messages.
 
-    def _message_thread_fn(self) -> None:
-        """Background thread to handle incoming messages."""
-        msg_remainder = ""
+        Args:
+            stop: Stop token of the connection that started this thread; once
+                set, the thread exits without touching the client's state
+        """
+        # Received bytes not yet split into frames
+        rxbuf = bytearray()
         consecutive_failures = 0
         max_failures = 10  # Increased from 3 to 10 for better resilience
         reconnect_delay = 2.0  # Start with 2 seconds, will increase on failures
         last_heartbeat_check = time.time()
 
-        while self._is_watch_events:
+        while self._is_watch_events and not stop.is_set():
             try:
                 if not self._connected:
                     # Try to reconnect synchronously in thread
                     logger.info("Attempting to reconnect to telescope...")
-                    if self._sync_reconnect():
+                    if self._sync_reconnect(stop):
                         consecutive_failures = 0
                         reconnect_delay = 2.0  # Reset delay on successful reconnect
                         self._last_heartbeat = time.time()
@@ -132,15 +467,19 @@ class SeestarClient:
                         consecutive_failures += 1
                         if consecutive_failures >= max_failures:
                             logger.error(
-                                f"Failed to reconnect after {max_failures} attempts, stopping message thread"
+                                "Failed to reconnect after %s attempts, stopping message thread",
+                                max_failures,
                             )
                             break
                         # Exponential backoff with max delay of 30 seconds
                         reconnect_delay = min(reconnect_delay * 1.5, 30.0)
                         logger.info(
-                            f"Reconnect attempt {consecutive_failures}/{max_failures} failed, waiting {reconnect_delay:.1f}s"
+                            "Reconnect attempt %s/%s failed, waiting %.1fs",
+                            consecutive_failures,
+                            max_failures,
+                            reconnect_delay,
                         )
-                        time.sleep(reconnect_delay)
+                        stop.wait(reconnect_delay)
                         continue
 
                 # Send periodic heartbeat to maintain connection
@@ -156,7 +495,7 @@ class SeestarClient:
                             self._json_message("test_connection")
                             self._last_heartbeat = current_time
                         except Exception as e:
-                            logger.warning(f"Heartbeat failed: {e}")
+                            logger.warning("Heartbeat failed: %s", e)
                             self._connected = False
                             continue
                     last_heartbeat_check = current_time
@@ -174,54 +513,79 @@ class SeestarClient:
                     if self.socket and original_timeout is not None:
                         self.socket.settimeout(original_timeout)
 
-                if data:
-                    consecutive_failures = 0  # Reset on successful receive
-                    self._last_heartbeat = (
-                        time.time()
-                    )  # Update heartbeat on any message
-                    msg_remainder += data
-                    first_index = msg_remainder.find("\r\n")
-
-                    while first_index >= 0:
-                        first_msg = msg_remainder[0:first_index]
-                        msg_remainder = msg_remainder[first_index + 2 :]
+                if stop.is_set():
+                    break
 
-                        try:
-                            parsed_data = json.loads(first_msg)
+                if not data:
+                    # recv() only returns nothing once the telescope closed the
+                    # connection; without this the loop would spin on EOF
+                    raise ConnectionError("Connection closed by telescope")
+
+                consecutive_failures = 0  # Reset on successful receive
+                self._last_heartbeat = time.time()  # Update heartbeat on any message
+                rxbuf += data
+
+                # Parse complete frames in place, then drop them all at once
+                start = 0
+                while (end := rxbuf.find(b"\r\n", start)) >= 0:
+                    try:
+                        with memoryview(rxbuf)[start:end] as frame:
+                            parsed_data = orjson.loads(frame)
+                        # Valid JSON that is not an object carries nothing to
+                        # dispatch; skip it rather than fail the connection
+                        if isinstance(parsed_data, dict):
                             self._handle_message(parsed_data)
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse JSON: {e}")
-
-                        first_index = msg_remainder.find("\r\n")
+                        else:
+                            logger.debug("Ignoring non-object frame: %r", parsed_data)
+                    except orjson.JSONDecodeError as e:
+                        logger.warning("Failed to parse JSON: %s", e)
+                    start = end + 2
+                del rxbuf[:start]
 
             except socket.timeout:
                 # Timeout is expected with shorter timeouts, don't count as failure
                 logger.debug("Socket receive timeout (normal)")
                 continue
             except Exception as e:
-                logger.warning(f"Message thread error (will retry): {e}")
+                if stop.is_set():
+                    # disconnect() shut the socket down to wake this thread
+                    break
+                logger.warning("Message thread error (will retry): %s", e)
                 self._connected = False
+                rxbuf.clear()  # Drop any partial frame from the lost connection
                 consecutive_failures += 1
 
                 if consecutive_failures >= max_failures:
                     logger.error(
-                        f"Too many consecutive failures ({consecutive_failures}), stopping message thread"
+                        "Too many consecutive failures (%s), stopping message thread",
+                        consecutive_failures,
                     )
                     break
 
-                time.sleep(2)  # Brief pause before retry
-
-            time.sleep(0.1)
+                stop.wait(2)  # Brief pause before retry
 
     def _handle_message(self, message: Dict[str, Any]) -> None:
         """Handle incoming message from telescope."""
-        logger.info(f"RECEIVED: {json.dumps(message)}")
+        # The arguments are built eagerly, so skip them when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("RECEIVED: %s", orjson.dumps(message).decode("utf-8"))
+
+        # Wake up any coroutine waiting for this command's reply
+        if isinstance(message.get("id"), int):
+            self._resolve_response(message)
+
+        # Wake up a focuser or filter wheel move waiting for completion
+        if message.get("Event") in _MOVE_EVENTS and message.get("state") in (
+            "complete",
+            "fail",
+        ):
+            self._resolve(self._move_waiters, message["Event"], message)
 
         # Handle AutoGoto events for slewing operations
         if "Event" in message and message["Event"] == "AutoGoto":
             state = message.get("state")
             error = message.get("error")
-            logger.info(f"AutoGoto state: {state}")
+            logger.info("AutoGoto state: %s", state)
 
             # Update operation state based on AutoGoto progress
             if state == "complete":
@@ -235,31 +599,31 @@ class SeestarClient:
                     logger.warning(
                         "Telescope slewing failed: Target is below horizon (not visible from current location/time)"
                     )
-                elif error and (
-                    "mount goto failed" in str(error).lower()
-                    or "goto failed" in str(error).lower()
-                ):
+                elif _is_goto_failure(error):
                     logger.warning(
-                        f"Telescope slewing failed: {error}. This may indicate telescope safety protection (e.g., solar pointing prevention)"
+                        "Telescope slewing failed: %s. This may indicate telescope safety protection (e.g., solar pointing prevention)",
+                        error,
                     )
                 else:
                     logger.warning(
-                        f"Telescope slewing failed: {error or 'Unknown error'}"
+                        "Telescope slewing failed: %s", error or "Unknown error"
                     )
             elif state in ["working", "slewing"]:
                 self._op_state = "working"
                 logger.info("Telescope is slewing to target")
             else:
-                logger.debug(f"AutoGoto intermediate state: {state}")
+                logger.debug("AutoGoto intermediate state: %s", state)
 
         # Handle other message types that might indicate operation completion
         if "result" in message and "code" in message:
             # Successful command response
             if message.get("code") == 0:
-                logger.debug(f"Command response: {message.get('result', 'OK')}")
+                logger.debug("Command response: %s", message.get("result", "OK"))
             else:
                 logger.warning(
-                    f"Command failed with code {message.get('code')}: {message.get('result', 'Unknown error')}"
+                    "Command failed with code %s: %s",
+                    message.get("code"),
+                    message.get("result", "Unknown error"),
                 )
 
     async def __aenter__(self) -> "SeestarClient":
@@ -286,18 +650,20 @@ class SeestarClient:
 
             # UDP initialization message
             message = {"id": 1, "method": "scan_iscope", "params": ""}
-            message_bytes = json.dumps(message).encode("utf-8")
+            message_bytes = orjson.dumps(message)
 
             # Send to UDP port 4720 (telescope's UDP listener)
             udp_addr = (self.host, 4720)
-            logger.debug(f"Sending UDP initialization to {udp_addr}: {message}")
+            logger.debug("Sending UDP initialization to %s: %s", udp_addr, message)
             udp_socket.sendto(message_bytes, udp_addr)
 
             # Try to receive response (optional, may timeout)
             try:
                 response, addr = udp_socket.recvfrom(1024)
                 logger.debug(
-                    f"UDP initialization response from {addr}: {response.decode('utf-8', errors='ignore')}"
+                    "UDP initialization response from %s: %s",
+                    addr,
+                    response.decode("utf-8", errors="ignore"),
                 )
             except socket.timeout:
                 logger.debug("UDP initialization sent, no response (this is normal)")
@@ -305,7 +671,47 @@ class SeestarClient:
             udp_socket.close()
 
         except Exception as e:
-            logger.warning(f"UDP initialization failed (continuing anyway): {e}")
+            logger.warning("UDP initialization failed (continuing anyway): %s", e)
+
+    @staticmethod
+    def _tune_socket(sock: socket.socket) -> None:
+        """Size socket buffers for event bursts and disable Nagle's algorithm."""
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _TCP_RCVBUF_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _TCP_SNDBUF_SIZE)
+            # Commands are small request/response frames, send them immediately
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            logger.debug("Could not tune telescope socket: %s", e)
+
+    @contextlib.contextmanager
+    def _cork(self) -> Iterator[None]:
+        """
+        Hold back partial TCP segments while several commands are written.
+
+        Uses TCP_CORK where the platform has it (Linux); leaving the block
+        flushes everything written inside it. Elsewhere this is a no-op.
+        """
+        sock = self.socket
+        cork: Optional[int] = getattr(socket, "TCP_CORK", None)
+        if sock is None or cork is None:
+            yield
+            return
+
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, cork, 1)
+        except OSError as e:
+            logger.debug("Could not cork telescope socket: %s", e)
+            yield
+            return
+
+        try:
+            yield
+        finally:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, cork, 0)
+            except OSError as e:
+                logger.debug("Could not uncork telescope socket: %s", e)
 
     async def connect(self) -> bool:
         """
@@ -314,6 +720,11 @@ class SeestarClient:
         Returns:
             True if connection successful, False otherwise
         """
+        if self._message_thread is not None:
+            # A reader from an earlier connection may still be reconnecting;
+            # stop it and drop its socket before opening a new one
+            await self.disconnect()
+
         try:
             # Step 1: Send UDP initialization to establish control
             await self._send_udp_handshake()
@@ -339,37 +750,39 @@ class SeestarClient:
             except (OSError, AttributeError):
                 # Some platforms don't support these, that's ok
                 pass
+            self._tune_socket(self.socket)
 
             self.socket.settimeout(self.timeout)
-            logger.info(f"Connecting to telescope at {self.host}:{self.port}")
+            logger.info("Connecting to telescope at %s:%s", self.host, self.port)
             self.socket.connect((self.host, self.port))
 
             self._connected = True
             self._is_watch_events = True
 
-            # Start message handling thread
-            self._message_thread = threading.Thread(
-                target=self._message_thread_fn, daemon=True
+            # Start message handling thread with a stop token of its own
+            self._reader_stop = Event()
+            self._message_thread = Thread(
+                target=self._message_thread_fn, args=(self._reader_stop,), daemon=True
             )
             self._message_thread.start()
 
             # Test connection with a simple command
-            self._json_message("test_connection")
+            cmdid = self._json_message("test_connection", expect_reply=True)
 
             # Give a moment for the connection to be established
-            await asyncio.sleep(1)
+            await self._wait_for_response(cmdid, 1.0)
 
             # Get device info to verify communication
             info = await self.get_device_info()
             if info:
                 self._telescope_info = info
                 logger.info(
-                    f"Connected to {info.device_name} at {self.host}:{self.port}"
+                    "Connected to %s at %s:%s", info.device_name, self.host, self.port
                 )
                 return True
 
         except Exception as e:
-            logger.error(f"Failed to connect to telescope: {e}")
+            logger.error("Failed to connect to telescope: %s", e)
             self._connected = False
             if self.socket:
                 try:
@@ -386,20 +799,47 @@ class SeestarClient:
         self._is_watch_events = False
         self._connected = False
 
+        if self._reader_stop is not None:
+            self._reader_stop.set()
+            self._reader_stop = None
+
         if self._message_thread and self._message_thread.is_alive():
-            self._message_thread.join(timeout=2.0)
+            # Wake a blocked recv(), then wait for the thread to exit so a
+            # later connect() never shares the socket with it
+            if self.socket:
+                try:
+                    self.socket.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    # Ignore errors when the socket is already disconnected
+                    pass
+            await asyncio.to_thread(self._message_thread.join)
+        self._message_thread = None
 
         if self.socket:
             self.socket.close()
             self.socket = None
 
+        # Waiters time out on their own, drop their futures
+        self._pending.clear()
+        self._move_waiters.clear()
+
         logger.info("Disconnected from telescope")
 
-    def _sync_reconnect(self) -> bool:
-        """Synchronous reconnect for use in message thread."""
+    def _sync_reconnect(self, stop: Event) -> bool:
+        """
+        Synchronous reconnect for use in message thread.
+
+        The new socket is built locally and only published to the client
+        while the thread's stop token is clear, so a thread stopped mid-way
+        never replaces or closes the socket of a newer connection.
+
+        Args:
+            stop: Stop token of the calling message thread
+        """
+        sock: Optional[socket.socket] = None
         try:
             # Close existing socket if any
-            if self.socket:
+            if self.socket and not stop.is_set():
                 try:
                     self.socket.close()
                 except (OSError, AttributeError):
@@ -408,13 +848,20 @@ class SeestarClient:
                 self.socket = None
 
             # Create new TCP socket connection
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             # Enable TCP keepalive to detect dead connections
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            self._tune_socket(sock)
             # Set shorter reconnect timeout
-            self.socket.settimeout(15.0)
-            self.socket.connect((self.host, self.port))
+            sock.settimeout(15.0)
+            sock.connect((self.host, self.port))
+
+            if stop.is_set():
+                # disconnect() or a new connect() took over while connecting
+                sock.close()
+                return False
 
+            self.socket = sock
             self._connected = True
 
             # Test connection with a simple command
@@ -423,15 +870,16 @@ class SeestarClient:
             return True
 
         except Exception as e:
-            logger.warning(f"Sync reconnect failed: {e}")
-            if self.socket:
+            logger.warning("Sync reconnect failed: %s", e)
+            if sock is not None:
                 try:
-                    self.socket.close()
+                    sock.close()
                 except (OSError, AttributeError):
                     # Ignore errors when closing socket - it may already be closed
                     pass
-                self.socket = None
-            self._connected = False
+                if self.socket is sock:
+                    self.socket = None
+                    self._connected = False
             return False
 
     @property
@@ -439,54 +887,50 @@ class SeestarClient:
         """Check if connected to telescope."""
         return self._connected and self.socket is not None
 
+    @_command_errors("get device info", default=None)
     async def get_device_info(self) -> Optional[TelescopeInfo]:
         """Get telescope device information."""
-        try:
-            # Try to get coordinates to verify connection
-            self._json_message("scope_get_equ_coord")
-
-            # Wait a bit for response
-            await asyncio.sleep(1.0)
-
-            # Return default device info since SeestarS50 doesn't provide detailed device info
-            return TelescopeInfo(
-                device_name="SeestarS50",
-                firmware_version="unknown",
-                hardware_version="unknown",
-                serial_number="unknown",
-                mount_type="alt-az",
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to get device info: {e}")
-            return None
+        # Try to get coordinates to verify connection
+        cmdid = self._json_message("scope_get_equ_coord", expect_reply=True)
+
+        # Wait a bit for response
+        await self._wait_for_response(cmdid, 1.0)
+
+        # Return default device info since SeestarS50 doesn't provide detailed device info
+        return TelescopeInfo(
+            device_name="SeestarS50",
+            firmware_version="unknown",
+            hardware_version="unknown",
+            serial_number="unknown",
+            mount_type="alt-az",
+        )
 
+    @_command_errors("get status", default=None)
     async def get_status(self) -> Optional[TelescopeState]:
         """Get current telescope status."""
-        try:
-            # Request current coordinates
-            self._json_message("scope_get_equ_coord")
-
-            # Wait for response (in a real implementation, we'd parse the response)
-            await asyncio.sleep(0.5)
-
-            # For now, return basic status
-            return TelescopeState(
-                status=TelescopeStatus.IDLE,
-                connected=self.is_connected,
-                ra=None,
-                dec=None,
-                az=None,
-                alt=None,
-                is_tracking=False,
-                is_parked=False,
-                current_target=None,
-                last_updated=datetime.now(),
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to get status: {e}")
-            return None
+        # Request current coordinates
+        cmdid = self._json_message("scope_get_equ_coord", expect_reply=True)
+        response = await self._wait_for_response(cmdid, 0.5)
+
+        # Merge in the position if the telescope replied in time
+        ra = dec = last_updated = None
+        result = response.get("result") if response else None
+        if isinstance(result, dict) and "ra" in result and "dec" in result:
+            ra, dec = result["ra"], result["dec"]
+            last_updated = datetime.now()
+
+        return TelescopeState(
+            status=TelescopeStatus.IDLE,
+            connected=self.is_connected,
+            ra=ra,
+            dec=dec,
+            az=None,
+            alt=None,
+            is_tracking=False,
+            is_parked=False,
+            current_target=None,
+            last_updated=last_updated,
+        )
 
     async def goto_coordinates(
         self,
@@ -524,7 +968,7 @@ class SeestarClient:
                     coordinates
                 )
 
-                logger.info(f"Target visibility: {status}")
+                logger.info("Target visibility: %s", status)
 
                 if not is_visible:
                     error_msg = (
@@ -576,7 +1020,11 @@ class SeestarClient:
                     params["target_name"] = display_name
 
             logger.info(
-                f"Slewing telescope to {display_name}: RA: {coordinates.ra:.6f}h ({ra_degrees:.6f}°), DEC: {coordinates.dec:.6f}°"
+                "Slewing telescope to %s: RA: %.6fh (%.6f°), DEC: %.6f°",
+                display_name,
+                coordinates.ra,
+                ra_degrees,
+                coordinates.dec,
             )
             self._json_message("iscope_start_view", params)
 
@@ -597,40 +1045,35 @@ class SeestarClient:
             # Check final state
             if self._op_state == "complete":
                 logger.info(
-                    f"Telescope AutoGoto to {display_name} completed successfully"
+                    "Telescope AutoGoto to %s completed successfully", display_name
                 )
                 return True
             elif self._op_state == "failed":
                 # Provide specific error message based on failure reason
-                error_msg = f"Telescope AutoGoto to {display_name} failed"
-                if hasattr(self, "_last_error_details"):
-                    error_details = getattr(self, "_last_error_details")
-                    error = error_details.get("error", "Unknown error")
-                    if error == "below horizon":
-                        error_msg = f"Target '{display_name}' is below the horizon and not visible from your current location at this time. Try a different target or wait until it rises."
-                    elif (
-                        "mount goto failed" in str(error).lower()
-                        or "goto failed" in str(error).lower()
+                error = (self._last_error_details or {}).get("error", "Unknown error")
+                if error == "below horizon":
+                    error_msg = f"Target '{display_name}' is below the horizon and not visible from your current location at this time. Try a different target or wait until it rises."
+                elif _is_goto_failure(error):
+                    # Check if this is a solar target based on display name
+                    if (
+                        "sun" in display_name.lower()
+                        or "☀" in display_name
+                        or "⚠" in display_name
                     ):
-                        # Check if this is a solar target based on display name
-                        if (
-                            "sun" in display_name.lower()
-                            or "☀" in display_name
-                            or "⚠" in display_name
-                        ):
-                            error_msg = f"Telescope slewing to '{display_name}' failed: {error}. The telescope may have built-in safety protection preventing solar pointing. Ensure proper solar filter is installed and telescope safety settings allow solar observation."
-                        else:
-                            error_msg = f"Telescope slewing to '{display_name}' failed: {error}. This may indicate a mechanical issue or safety protection."
+                        error_msg = f"Telescope slewing to '{display_name}' failed: {error}. The telescope may have built-in safety protection preventing solar pointing. Ensure proper solar filter is installed and telescope safety settings allow solar observation."
                     else:
-                        error_msg = (
-                            f"Telescope slewing to '{display_name}' failed: {error}"
-                        )
+                        error_msg = f"Telescope slewing to '{display_name}' failed: {error}. This may indicate a mechanical issue or safety protection."
+                else:
+                    error_msg = f"Telescope slewing to '{display_name}' failed: {error}"
                 logger.error(error_msg)
                 raise RuntimeError(error_msg)
             else:
                 # Timeout case - the command was sent, AutoGoto might still be in progress
                 logger.warning(
-                    f"AutoGoto to {display_name} timeout after {timeout}s, state: {self._op_state}"
+                    "AutoGoto to %s timeout after %ss, state: %s",
+                    display_name,
+                    timeout,
+                    self._op_state,
                 )
                 # Return True as the slew command was successfully sent
                 return True
@@ -639,9 +1082,10 @@ class SeestarClient:
             # Re-raise runtime errors (like below horizon) to propagate specific messages
             raise
         except Exception as e:
-            logger.error(f"Failed to goto coordinates: {e}")
+            logger.error("Failed to goto coordinates: %s", e)
             raise RuntimeError(f"Failed to slew telescope: {e}")
 
+    @_command_errors("start imaging", default=False)
     async def start_imaging(self, params: ImagingParams) -> bool:
         """
         Start imaging session.
@@ -652,68 +1096,62 @@ class SeestarClient:
         Returns:
             True if imaging started successfully
         """
-        try:
-            # Start stacking with optional mosaic parameters
-            stack_params: Dict[str, Any] = {"restart": True}
-
-            # Add mosaic parameters if enabled
-            if params.mosaic_mode:
-                stack_params["mosaic"] = {
-                    "enable": True,
-                    "width": params.mosaic_width,
-                    "height": params.mosaic_height,
-                }
-                logger.info(
-                    f"Starting mosaic imaging: {params.mosaic_width}x{params.mosaic_height}, "
-                    f"{params.exposure_time}s x {params.count} exposures"
-                )
-            else:
-                logger.info(
-                    f"Starting standard imaging: {params.exposure_time}s x {params.count} exposures"
-                )
-
-            self._json_message("iscope_start_stack", stack_params)
-            await asyncio.sleep(1)
+        # Start stacking with optional mosaic parameters
+        stack_params: Dict[str, Any] = {"restart": True}
+
+        # Add mosaic parameters if enabled
+        if params.mosaic_mode:
+            stack_params["mosaic"] = {
+                "enable": True,
+                "width": params.mosaic_width,
+                "height": params.mosaic_height,
+            }
+            logger.info(
+                "Starting mosaic imaging: %sx%s, %ss x %s exposures",
+                params.mosaic_width,
+                params.mosaic_height,
+                params.exposure_time,
+                params.count,
+            )
+        else:
+            logger.info(
+                "Starting standard imaging: %ss x %s exposures",
+                params.exposure_time,
+                params.count,
+            )
 
-            return True
+        cmdid = self._json_message(
+            "iscope_start_stack", stack_params, expect_reply=True
+        )
+        await self._wait_for_response(cmdid, 1.0)
 
-        except Exception as e:
-            logger.error(f"Failed to start imaging: {e}")
-            return False
+        return True
 
+    @_command_errors("stop imaging", default=False)
     async def stop_imaging(self) -> bool:
         """Stop current imaging session."""
-        try:
-            # Stop stacking
-            stop_params = {"stage": "Stack"}
-
-            self._json_message("iscope_stop_view", stop_params)
-            await asyncio.sleep(1)
+        # Stop stacking
+        stop_params = {"stage": "Stack"}
 
-            return True
+        cmdid = self._json_message("iscope_stop_view", stop_params, expect_reply=True)
+        await self._wait_for_response(cmdid, 1.0)
 
-        except Exception as e:
-            logger.error(f"Failed to stop imaging: {e}")
-            return False
+        return True
 
+    @_command_errors("get imaging status", default=None)
     async def get_imaging_status(self) -> Optional[ImagingState]:
         """Get current imaging status."""
-        try:
-            # SeestarS50 doesn't provide detailed imaging status via API
-            # Return basic status for now
-            return ImagingState(
-                status=ImagingStatus.STOPPED,
-                progress=0,
-                current_image=0,
-                total_images=0,
-                exposure_time=None,
-                time_remaining=None,
-                last_image_path=None,
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to get imaging status: {e}")
-            return None
+        # SeestarS50 doesn't provide detailed imaging status via API
+        # Return basic status for now
+        return ImagingState(
+            status=ImagingStatus.STOPPED,
+            progress=0,
+            current_image=0,
+            total_images=0,
+            exposure_time=None,
+            time_remaining=None,
+            last_image_path=None,
+        )
 
     async def start_calibration(self) -> bool:
         """Start telescope calibration sequence."""
@@ -727,23 +1165,20 @@ class SeestarClient:
         logger.error(error_msg)
         raise RuntimeError(error_msg)
 
+    @_command_errors("get calibration status", default=None)
     async def get_calibration_status(self) -> Optional[CalibrationState]:
         """Get current calibration status."""
-        try:
-            # SeestarS50 calibration status is not available via API
-            return CalibrationState(
-                status=CalibrationStatus.NOT_STARTED,
-                progress=0,
-                current_step=None,
-                steps_completed=0,
-                total_steps=0,
-                error_message=None,
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to get calibration status: {e}")
-            return None
+        # SeestarS50 calibration status is not available via API
+        return CalibrationState(
+            status=CalibrationStatus.NOT_STARTED,
+            progress=0,
+            current_step=None,
+            steps_completed=0,
+            total_steps=0,
+            error_message=None,
+        )
 
+    @_command_errors("park telescope")
     async def park_telescope(self, eq_mode: bool = False) -> dict:
         """
         Park telescope using correct SeestarS50 command.
@@ -754,41 +1189,27 @@ class SeestarClient:
         Returns:
             dict: Result of park operation
         """
-        try:
-            logger.info(f"Parking telescope (EQ mode: {eq_mode})...")
+        logger.info("Parking telescope (EQ mode: %s)...", eq_mode)
 
-            # Use the confirmed working scope_park command
-            self._json_message("scope_park", {"equ_mode": eq_mode})
+        # Use the confirmed working scope_park command
+        cmdid = self._json_message(
+            "scope_park", {"equ_mode": eq_mode}, expect_reply=True
+        )
 
-            # Wait for command to complete
-            await asyncio.sleep(3)
+        # Wait for command to complete
+        await self._wait_for_response(cmdid, 3.0)
 
-            logger.info("Telescope park command sent successfully")
-            return {
-                "message": f"Telescope park command sent (EQ mode: {eq_mode})",
-                "eq_mode": eq_mode,
-                "success": True,
-            }
+        logger.info("Telescope park command sent successfully")
+        return {
+            "message": f"Telescope park command sent (EQ mode: {eq_mode})",
+            "eq_mode": eq_mode,
+            "success": True,
+        }
 
-        except Exception as e:
-            logger.error(f"Failed to park telescope: {e}")
-            return {"error": str(e), "success": False}
-
-    def _is_solar_target(self, target_name: str) -> bool:
+    @staticmethod
+    def _is_solar_target(target_name: str) -> bool:
         """Check if target is solar system object requiring special handling."""
-        solar_targets = [
-            "sun",
-            "solar",
-            "sol",
-            "mercury",
-            "venus",
-            "mars",
-            "jupiter",
-            "saturn",
-            "uranus",
-            "neptune",
-        ]
-        return any(solar_name in target_name.lower() for solar_name in solar_targets)
+        return bool(_SOLAR_RE.search(target_name))
 
     async def start_solar_observation(self, target_name: str) -> dict:
         """
@@ -801,22 +1222,28 @@ class SeestarClient:
             dict: Result of solar mode initialization
         """
         try:
-            logger.info(f"Starting solar observation mode for {target_name}")
-
-            # Start solar viewing mode
-            self._json_message("iscope_start_view", {"mode": "sun"})
-
-            # Start solar tracking/scanning
-            self._json_message("start_scan_planet")
-
-            # Clear any previous solar state
-            self._json_message("clear_app_state", {"name": "ScanSun"})
+            logger.info("Starting solar observation mode for %s", target_name)
+
+            # Start solar viewing mode, start solar tracking/scanning and
+            # clear any previous solar state in one write
+            cmdids = self._json_message_batch(
+                [
+                    ("iscope_start_view", {"mode": "sun"}),
+                    ("start_scan_planet", None),
+                    ("clear_app_state", {"name": "ScanSun"}),
+                ],
+                expect_reply=True,
+            )
 
-            # Wait a moment for solar mode to initialize
-            await asyncio.sleep(3)
+            # Wait a moment for solar mode to initialize; replies arrive in
+            # order, so the three waits share one deadline
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 3.0
+            for cmdid in cmdids:
+                await self._wait_for_response(cmdid, max(deadline - loop.time(), 0))
 
             logger.info(
-                f"Solar observation mode started successfully for {target_name}"
+                "Solar observation mode started successfully for %s", target_name
             )
             return {
                 "message": f"Solar observation mode started for {target_name}",
@@ -825,27 +1252,24 @@ class SeestarClient:
             }
 
         except Exception as e:
-            logger.error(f"Failed to start solar observation for {target_name}: {e}")
+            logger.error("Failed to start solar observation for %s: %s", target_name, e)
             return {"error": str(e), "target": target_name, "success": False}
 
-    async def get_comprehensive_state(self) -> dict:
+    @_command_errors("get device state")
+    async def get_comprehensive_state(self) -> Mapping[str, Any]:
         """Get comprehensive device state including sensors."""
-        try:
-            # Send command and get response
-            self._json_message(
-                "get_device_state", {"keys": ["balance_sensor", "compass_sensor"]}
-            )
-
-            # Wait for response
-            await asyncio.sleep(2)
+        # Send command and get response
+        cmdid = self._json_message(
+            "get_device_state", {"keys": _SENSOR_KEYS}, expect_reply=True
+        )
 
-            return {"message": "Device state requested", "success": True}
+        # Wait for response
+        await self._wait_for_response(cmdid, 2.0)
 
-        except Exception as e:
-            logger.error(f"Failed to get device state: {e}")
-            return {"error": str(e), "success": False}
+        return _OK_DEVICE_STATE_REQUESTED
 
-    async def unpark_telescope(self) -> dict:
+    @_command_errors("open telescope arm")
+    async def unpark_telescope(self) -> Mapping[str, Any]:
         """
         Unpark telescope using correct SeestarS50 commands.
         Uses scope_move_to_horizon to position arm properly.
@@ -853,160 +1277,194 @@ class SeestarClient:
         Returns:
             dict: Results of positioning operations
         """
-        try:
-            logger.info("Starting telescope arm opening sequence...")
-
-            # Use scope_move_to_horizon to position telescope arm
-            # This is the correct command that actually works on SeestarS50
-            self._json_message("scope_move_to_horizon")
-
-            # Wait for horizon movement to complete
-            await asyncio.sleep(5)
-
-            # Get device state to verify positioning
-            self._json_message(
-                "get_device_state", {"keys": ["balance_sensor", "compass_sensor"]}
-            )
+        logger.info("Starting telescope arm opening sequence...")
+
+        # Use scope_move_to_horizon to position telescope arm
+        # This is the correct command that actually works on SeestarS50,
+        # and request the device state to verify positioning in the same write
+        horizon_id, state_id = self._json_message_batch(
+            [
+                ("scope_move_to_horizon", None),
+                (
+                    "get_device_state",
+                    {"keys": _SENSOR_KEYS},
+                ),
+            ],
+            expect_reply=True,
+        )
 
-            # Wait a moment for state response
-            await asyncio.sleep(2)
+        # Wait for horizon movement to complete, then for the state response
+        await self._wait_for_response(horizon_id, 5.0)
+        await self._wait_for_response(state_id, 2.0)
 
-            logger.info("Telescope arm opening sequence completed successfully")
-            return {
-                "message": "Telescope arm opening sequence completed using scope_move_to_horizon",
-                "success": True,
-            }
-
-        except Exception as e:
-            logger.error(f"Failed to open telescope arm: {e}")
-            return {"error": str(e), "success": False}
+        logger.info("Telescope arm opening sequence completed successfully")
+        return _OK_UNPARKED
 
+    @_command_errors("emergency stop", default=False)
     async def emergency_stop(self) -> bool:
         """Emergency stop all telescope operations."""
-        try:
-            # Stop all operations
-            stop_params = {"stage": "All"}
+        # Stop all operations
+        stop_params = {"stage": "All"}
 
-            self._json_message("iscope_stop_view", stop_params)
-            await asyncio.sleep(0.5)
-
-            return True
+        # sendall() has already handed the command to the kernel, so only
+        # yield to the loop instead of waiting on a timer
+        self._json_message("iscope_stop_view", stop_params)
+        await asyncio.sleep(0)
 
-        except Exception as e:
-            logger.error(f"Failed to emergency stop: {e}")
-            return False
+        return True
 
     # Enhanced commands from seestar_alp analysis
 
-    async def get_device_state(self) -> Optional[Dict[str, Any]]:
+    @_command_errors("get device state", default=None)
+    async def get_device_state(self) -> Optional[Mapping[str, Any]]:
         """Get comprehensive device state information."""
-        try:
-            self._json_message("get_device_state")
-            await asyncio.sleep(1)
+        cmdid = self._json_message("get_device_state", expect_reply=True)
+        await self._wait_for_response(cmdid, 1.0)
 
-            # This would need proper response parsing
-            # For now, return basic status
-            return {"status": "available", "connection": "connected"}
+        # This would need proper response parsing
+        # For now, return basic status
+        return _DEVICE_STATE
 
-        except Exception as e:
-            logger.error(f"Failed to get device state: {e}")
-            return None
-
-    async def get_station_state(self) -> Optional[Dict[str, Any]]:
+    @_command_errors("get station state", default=None)
+    async def get_station_state(self) -> Optional[Mapping[str, Any]]:
         """Get telescope station mode state."""
-        try:
-            self._json_message("pi_station_state")
-            await asyncio.sleep(1)
+        cmdid = self._json_message("pi_station_state", expect_reply=True)
+        await self._wait_for_response(cmdid, 1.0)
 
-            return {"mode": "station", "connected": True}
+        return _STATION_STATE
 
-        except Exception as e:
-            logger.error(f"Failed to get station state: {e}")
-            return None
-
-    async def get_view_state(self) -> Optional[Dict[str, Any]]:
+    @_command_errors("get view state", default=None)
+    async def get_view_state(self) -> Optional[Mapping[str, Any]]:
         """Get current telescope view state."""
-        try:
-            self._json_message("get_view_state")
-            await asyncio.sleep(1)
-
-            return {"viewing": False, "target": None}
+        cmdid = self._json_message("get_view_state", expect_reply=True)
+        await self._wait_for_response(cmdid, 1.0)
 
-        except Exception as e:
-            logger.error(f"Failed to get view state: {e}")
-            return None
+        return _VIEW_STATE
 
-    async def get_stack_setting(self) -> Optional[Dict[str, Any]]:
+    @_command_errors("get stack setting", default=None)
+    async def get_stack_setting(self) -> Optional[Mapping[str, Any]]:
         """Get current stacking/imaging settings."""
-        try:
-            self._json_message("get_stack_setting")
-            await asyncio.sleep(1)
-
-            return {"exposure": 10, "gain": 100, "count": 10}
+        cmdid = self._json_message("get_stack_setting", expect_reply=True)
+        await self._wait_for_response(cmdid, 1.0)
 
-        except Exception as e:
-            logger.error(f"Failed to get stack setting: {e}")
-            return None
+        return _STACK_SETTING
 
+    @_command_errors("set stack setting", default=False)
     async def set_stack_setting(self, settings: Dict[str, Any]) -> bool:
         """Set stacking/imaging settings."""
-        try:
-            self._json_message("set_stack_setting", settings)
-            await asyncio.sleep(1)
-
-            return True
+        cmdid = self._json_message("set_stack_setting", settings, expect_reply=True)
+        await self._wait_for_response(cmdid, 1.0)
 
-        except Exception as e:
-            logger.error(f"Failed to set stack setting: {e}")
-            return False
+        return True
 
+    @_command_errors("get focuser position", default=None)
     async def get_focuser_position(self) -> Optional[int]:
         """Get current focuser position."""
-        try:
-            self._json_message("get_focuser_position")
-            await asyncio.sleep(1)
+        cmdid = self._json_message("get_focuser_position", expect_reply=True)
+        await self._wait_for_response(cmdid, 1.0)
 
-            # Would need proper response parsing
-            return 5000  # Default position
+        # Would need proper response parsing
+        return 5000  # Default position
 
-        except Exception as e:
-            logger.error(f"Failed to get focuser position: {e}")
-            return None
+    async def _move_and_wait(
+        self, event: str, method: str, params: Dict[str, Any]
+    ) -> bool:
+        """
+        Send a move command and wait briefly for its completion event.
 
-    async def set_focuser_position(self, position: int) -> bool:
-        """Set focuser position."""
-        try:
-            params = {"position": position}
-            self._json_message("set_focuser_position", params)
-            await asyncio.sleep(2)  # Focus moves can take time
+        Args:
+            event: Event name the telescope sends when the move finishes
+            method: Move command to send
+            params: Move command parameters
 
+        Returns:
+            False if the telescope reported the move failed, True otherwise
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._move_waiters[event] = future
+        timeout = min(self.timeout, _MOVE_EVENT_TIMEOUT)
+        try:
+            self._json_message(method, params)
+            message = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "No %s event within %ss, assuming the move completed",
+                event,
+                timeout,
+            )
             return True
+        finally:
+            if self._move_waiters.get(event) is future:
+                del self._move_waiters[event]
 
-        except Exception as e:
-            logger.error(f"Failed to set focuser position: {e}")
+        if message.get("state") != "complete":
+            logger.warning(
+                "%s failed: %s", event, message.get("error", "Unknown error")
+            )
             return False
+        return True
+
+    @_command_errors("set focuser position", default=False)
+    async def set_focuser_position(self, position: int) -> bool:
+        """Set focuser position."""
+        params = {"position": position}
+        return await self._move_and_wait(
+            _FOCUSER_MOVE_EVENT, "set_focuser_position", params
+        )
 
-    async def get_wheel_state(self) -> Optional[Dict[str, Any]]:
+    @_command_errors("get wheel state", default=None)
+    async def get_wheel_state(self) -> Optional[Mapping[str, Any]]:
         """Get filter wheel state."""
-        try:
-            self._json_message("get_wheel_state")
-            await asyncio.sleep(1)
+        cmdid = self._json_message("get_wheel_state", expect_reply=True)
+        await self._wait_for_response(cmdid, 1.0)
 
-            return {"id": 0, "state": "idle", "unidirection": False}
+        return _WHEEL_STATE
 
-        except Exception as e:
-            logger.error(f"Failed to get wheel state: {e}")
-            return None
+    async def snapshot(self) -> Dict[str, Any]:
+        """
+        Query all status probes concurrently.
 
-    async def set_wheel_position(self, position: int) -> bool:
-        """Set filter wheel position."""
-        try:
-            params = {"position": position}
-            self._json_message("set_wheel_position", params)
-            await asyncio.sleep(2)
+        Returns:
+            Probe results keyed by name; probes that fail or do not finish
+            within the client timeout are None
+        """
+        probes = {
+            "device_state": self.get_device_state(),
+            "station_state": self.get_station_state(),
+            "view_state": self.get_view_state(),
+            "stack_setting": self.get_stack_setting(),
+            "wheel_state": self.get_wheel_state(),
+            "focuser_position": self.get_focuser_position(),
+        }
+        # Each probe writes its command as soon as its task first runs; let
+        # them all run once while corked so the six commands share packets
+        with self._cork():
+            tasks: Dict[str, "asyncio.Task[Any]"] = {
+                name: asyncio.create_task(coro) for name, coro in probes.items()
+            }
+            await asyncio.sleep(0)
 
-            return True
+        _, pending = await asyncio.wait(
+            tasks.values(), return_when=asyncio.ALL_COMPLETED, timeout=self.timeout
+        )
+        for task in pending:
+            task.cancel()
+        # Let the cancelled probes unwind before their results are read
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        return {
+            name: (
+                None
+                if task.cancelled() or task.exception() is not None
+                else task.result()
+            )
+            for name, task in tasks.items()
+        }
 
-        except Exception as e:
-            logger.error(f"Failed to set wheel position: {e}")
-            return False
+    @_command_errors("set wheel position", default=False)
+    async def set_wheel_position(self, position: int) -> bool:
+        """Set filter wheel position."""
+        params = {"position": position}
+        return await self._move_and_wait(
+            _WHEEL_MOVE_EVENT, "set_wheel_position", params
+        )
@@ -13,18 +13,38 @@ from seestar_mcp.models import (
     ImagingState,
     ImagingStatus,
     Target,
+    TargetSearchResult,
     TelescopeInfo,
     TelescopeState,
     TelescopeStatus,
 )
+from seestar_mcp.server import create_server
 from seestar_mcp.target_resolver import TargetResolver
 from seestar_mcp.telescope_client import SeestarClient
 
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
+# Targets the mock resolver knows, and the results it answers with
+_M31 = Target.model_construct(
+    name="M31",
+    coordinates=Coordinates.model_construct(ra=0.712, dec=41.269, epoch="J2000"),
+    magnitude=3.4,
+    object_type="galaxy",
+)
+_KNOWN_TARGETS = frozenset({"m31", "andromeda galaxy", "andromeda"})
+_FOUND = TargetSearchResult.model_construct(found=True, target=_M31, search_query="")
+_NOT_FOUND = TargetSearchResult.model_construct(
+    found=False, alternatives=["M31", "Andromeda Galaxy"], search_query=""
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_telescope_info():
     """Mock telescope device information."""
-    return TelescopeInfo(
+    return TelescopeInfo.model_construct(
         device_name="SeestarS50",
         firmware_version="1.0.0",
         hardware_version="2.0",
@@ -33,10 +53,10 @@ def mock_telescope_info():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_telescope_state():
     """Mock telescope state."""
-    return TelescopeState(
+    return TelescopeState.model_construct(
         status=TelescopeStatus.IDLE,
         connected=True,
         ra=12.5,
@@ -52,7 +72,7 @@ def mock_telescope_state():
 @pytest.fixture
 def mock_imaging_state():
     """Mock imaging state."""
-    return ImagingState(
+    return ImagingState.model_construct(
         status=ImagingStatus.STOPPED,
         progress=0,
         current_image=0,
@@ -66,7 +86,7 @@ def mock_imaging_state():
 @pytest.fixture
 def mock_calibration_state():
     """Mock calibration state."""
-    return CalibrationState(
+    return CalibrationState.model_construct(
         status=CalibrationStatus.NOT_STARTED,
         progress=0,
         current_step=None,
@@ -76,99 +96,142 @@ def mock_calibration_state():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_target():
     """Mock astronomical target."""
-    return Target(
-        name="M31",
-        coordinates=Coordinates(ra=0.712, dec=41.269, epoch="J2000"),
-        magnitude=3.4,
-        object_type="galaxy",
-    )
+    return _M31
+
+
+@pytest.fixture(scope="session")
+def _http_session():
+    """Spec-less AsyncMock standing in for an httpx client, built once."""
+    return AsyncMock(spec=None)
 
 
 @pytest.fixture
-def mock_httpx_client():
-    """Mock httpx AsyncClient."""
-    client = AsyncMock()
-
-    # Mock successful connection response
-    response = Mock()
-    response.status_code = 200
-    response.json.return_value = {
-        "device_name": "SeestarS50",
-        "firmware_version": "1.0.0",
-        "hardware_version": "2.0",
-        "serial_number": "SS50-12345",
-        "mount_type": "alt-az",
-    }
+def mock_http_session(_http_session):
+    """Shared mock httpx session, reset after each test."""
+    yield _http_session
+    _http_session.reset_mock(return_value=True, side_effect=True)
+    # Resetting return values also clears the one __bool__ is configured with
+    _http_session.__bool__.return_value = True
+
+
+# Socket methods SeestarClient calls, used as the mock socket's spec
+_SOCKET_METHODS = [
+    "settimeout",
+    "gettimeout",
+    "setsockopt",
+    "sendall",
+    "recv",
+    "close",
+    "connect",
+]
+
+
+# Methods replaced on the shared mock client, with the return values that
+# reset_mock_telescope_client restores before every test
+_MOCKED_CLIENT_METHODS = (
+    "connect",
+    "disconnect",
+    "get_device_info",
+    "get_status",
+    "goto_coordinates",
+    "start_imaging",
+    "stop_imaging",
+    "get_imaging_status",
+    "start_calibration",
+    "get_calibration_status",
+    "park_telescope",
+    "unpark_telescope",
+    "emergency_stop",
+)
+
 
-    client.request.return_value = response
-    client.get.return_value = response
-    client.post.return_value = response
+@pytest.fixture(scope="session")
+def mock_telescope_client():
+    """Mock SeestarClient, shared by the session and reset before each test."""
+    client = SeestarClient("192.168.1.100", 4700, 30.0)
+    # Mock the socket to make is_connected work; the short spec list still
+    # rejects misspelled attributes without walking dir(socket.socket)
+    client.socket = Mock(spec=_SOCKET_METHODS)
+
+    # Mock methods
+    for name in _MOCKED_CLIENT_METHODS:
+        setattr(client, name, AsyncMock())
 
     return client
 
 
-@pytest.fixture
-async def mock_telescope_client(
-    mock_httpx_client, mock_telescope_info, mock_telescope_state
+@pytest.fixture(autouse=True)
+def reset_mock_telescope_client(
+    mock_telescope_client, mock_telescope_info, mock_telescope_state
 ):
-    """Mock SeestarClient."""
-    client = SeestarClient("192.168.1.100", 4700, 30.0)
-    client.session = mock_httpx_client
+    """Restore the shared mock client's state and return values."""
+    client = mock_telescope_client
     client._connected = True
-    client.socket = Mock()  # Mock the socket to make is_connected work
     client._telescope_info = mock_telescope_info
 
-    # Mock methods
-    client.connect = AsyncMock(return_value=True)
-    client.disconnect = AsyncMock()
-    client.get_device_info = AsyncMock(return_value=mock_telescope_info)
-    client.get_status = AsyncMock(return_value=mock_telescope_state)
-    client.goto_coordinates = AsyncMock(return_value=True)
-    client.start_imaging = AsyncMock(return_value=True)
-    client.stop_imaging = AsyncMock(return_value=True)
-    client.get_imaging_status = AsyncMock(return_value=None)
-    client.start_calibration = AsyncMock(return_value=True)
-    client.get_calibration_status = AsyncMock(return_value=None)
-    client.park_telescope = AsyncMock(return_value=True)
-    client.unpark_telescope = AsyncMock(return_value=True)
-    client.emergency_stop = AsyncMock(return_value=True)
-
-    return client
+    return_values = {
+        "connect": True,
+        "get_device_info": mock_telescope_info,
+        "get_status": mock_telescope_state,
+        "goto_coordinates": True,
+        "start_imaging": True,
+        "stop_imaging": True,
+        "start_calibration": True,
+        "park_telescope": True,
+        "unpark_telescope": True,
+        "emergency_stop": True,
+    }
+    for name in _MOCKED_CLIENT_METHODS:
+        method = getattr(client, name)
+        method.reset_mock(return_value=True, side_effect=True)
+        method.return_value = return_values.get(name)
 
 
-@pytest.fixture
-async def mock_target_resolver(mock_target):
-    """Mock TargetResolver."""
+@pytest.fixture(scope="session")
+def mock_target_resolver():
+    """Mock TargetResolver; its replaced resolve_target never opens a session."""
     resolver = TargetResolver()
 
     # Mock the resolution methods
     async def mock_resolve_target(target_name):
-        from seestar_mcp.models import TargetSearchResult
-
-        if target_name.lower() in ["m31", "andromeda galaxy", "andromeda"]:
-            return TargetSearchResult(
-                found=True, target=mock_target, search_query=target_name
-            )
-        else:
-            return TargetSearchResult(
-                found=False,
-                alternatives=["M31", "Andromeda Galaxy"],
-                search_query=target_name,
-            )
+        result = _FOUND if target_name.lower() in _KNOWN_TARGETS else _NOT_FOUND
+        return result.model_copy(update={"search_query": target_name})
 
     resolver.resolve_target = mock_resolve_target
     return resolver
 
 
-@pytest.fixture
-def event_loop():
-    """Create an event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+@pytest.fixture(scope="session")
+def mcp_server():
+    """MCP server shared by the session; tests patch its module globals."""
+    return create_server()
+
+
+@pytest.fixture(scope="session")
+async def tools_by_name(mcp_server):
+    """Registered MCP tools of the shared server, keyed by tool name."""
+    return {tool.name: tool for tool in await mcp_server._list_tools()}
+
+
+def pytest_addoption(parser):
+    """Let profiling runs choose the event loop the async tests run on."""
+    parser.addoption(
+        "--event-loop",
+        choices=("uvloop", "asyncio"),
+        default="uvloop",
+        help="event loop for async tests (default: uvloop where available)",
+    )
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy(request):
+    """Run async tests on uvloop where available, as the server does."""
+    if uvloop is None or request.config.getoption("event_loop") == "asyncio":
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
 
 
 @pytest.fixture
@@ -40,6 +40,17 @@ class TestModels:
 
         assert coords.epoch == "J2000"
 
+    def test_coordinates_frozen(self):
+        """Test that coordinates cannot be changed after creation."""
+        coords = Coordinates(ra=12.5, dec=35.7)
+
+        with pytest.raises(ValidationError):
+            coords.ra = 1.0
+
+        moved = coords.model_copy(update={"ra": 1.0})
+        assert moved.ra == 1.0
+        assert coords.ra == 12.5
+
     def test_target_valid(self):
         """Test valid target creation."""
         coords = Coordinates(ra=0.712, dec=41.269)
@@ -89,23 +100,20 @@ class TestModels:
         assert params.binning == 2
         assert params.filter_name == "Ha"
 
-    def test_imaging_params_validation(self):
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"exposure_time": 0, "count": 10},
+            {"exposure_time": 120.0, "count": 0},
+            {"exposure_time": 120.0, "count": 10, "gain": 400},
+            {"exposure_time": 120.0, "count": 10, "binning": 5},
+        ],
+        ids=["exposure_time", "count", "gain", "binning"],
+    )
+    def test_imaging_params_validation(self, kwargs):
         """Test imaging parameters validation."""
-        # Test exposure_time > 0
-        with pytest.raises(ValidationError):
-            ImagingParams(exposure_time=0, count=10)
-
-        # Test count > 0
-        with pytest.raises(ValidationError):
-            ImagingParams(exposure_time=120.0, count=0)
-
-        # Test gain range
-        with pytest.raises(ValidationError):
-            ImagingParams(exposure_time=120.0, count=10, gain=400)
-
-        # Test binning range
         with pytest.raises(ValidationError):
-            ImagingParams(exposure_time=120.0, count=10, binning=5)
+            ImagingParams(**kwargs)
 
     def test_imaging_state_valid(self):
         """Test valid imaging state."""
@@ -123,15 +131,15 @@ class TestModels:
         assert state.current_image == 5
         assert state.total_images == 10
 
-    def test_imaging_state_validation(self):
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"progress": 150}, {"current_image": -1}],
+        ids=["progress", "current_image"],
+    )
+    def test_imaging_state_validation(self, kwargs):
         """Test imaging state validation."""
-        # Test progress range
-        with pytest.raises(ValidationError):
-            ImagingState(status=ImagingStatus.RUNNING, progress=150)  # > 100
-
-        # Test current_image >= 0
         with pytest.raises(ValidationError):
-            ImagingState(status=ImagingStatus.RUNNING, current_image=-1)
+            ImagingState(status=ImagingStatus.RUNNING, **kwargs)
 
     def test_calibration_state_valid(self):
         """Test valid calibration state."""
@@ -164,18 +172,15 @@ class TestModels:
         assert params.port == 4700
         assert params.timeout == 30.0
 
-    def test_connection_params_validation(self):
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"port": 0}, {"port": 70000}, {"timeout": 0}],
+        ids=["port_low", "port_high", "timeout"],
+    )
+    def test_connection_params_validation(self, kwargs):
         """Test connection parameters validation."""
-        # Test port range
-        with pytest.raises(ValidationError):
-            ConnectionParams(host="192.168.1.100", port=0)
-
-        with pytest.raises(ValidationError):
-            ConnectionParams(host="192.168.1.100", port=70000)
-
-        # Test timeout > 0
         with pytest.raises(ValidationError):
-            ConnectionParams(host="192.168.1.100", timeout=0)
+            ConnectionParams(host="192.168.1.100", **kwargs)
 
     def test_response_valid(self):
         """Test valid response."""
@@ -5,7 +5,7 @@ disconnect_tool = next(
 )ty."""
 
 import asyncio
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -14,10 +14,24 @@ from seestar_mcp.models import (
     Coordinates,
     ImagingStatus,
     Target,
+    TargetSearchResult,
     TelescopeStatus,
 )
 from seestar_mcp.server import create_server
 
+# Keep these tests on one xdist worker so the session-scoped server, tool map
+# and mock client are built once
+pytestmark = pytest.mark.xdist_group("server")
+
+
+@pytest.fixture(autouse=True)
+def patched_telescope_client(request, monkeypatch, mock_telescope_client):
+    """Install the shared mock client, or no client for no_client tests."""
+    client = mock_telescope_client
+    if request.node.get_closest_marker("no_client"):
+        client = None
+    monkeypatch.setattr("seestar_mcp.server._telescope_client", client)
+
 
 class TestMCPServer:
     """Test cases for MCP server tools."""
@@ -29,117 +43,115 @@ class TestMCPServer:
         assert server is not None
         assert server.name == "seestar-mcp"
 
-    @pytest.mark.asyncio
-    async def test_connect_telescope_success(self, mock_telescope_client, mock_context):
+    def test_tools_by_name(self, tools_by_name):
+        """Test the shared tool map is keyed by each registered tool's name."""
+        assert {
+            "connect_telescope",
+            "disconnect_telescope",
+            "get_telescope_status",
+            "goto_target",
+            "start_imaging",
+            "stop_imaging",
+            "emergency_stop",
+        } <= tools_by_name.keys()
+        assert all(tool.name == name for name, tool in tools_by_name.items())
+
+    @pytest.mark.no_client
+    async def test_connect_telescope_success(
+        self, monkeypatch, tools_by_name, mock_telescope_client, mock_context
+    ):
         """Test successful telescope connection."""
-        server = create_server()
+        mock_telescope_client._connected = False
 
-        # Mock global telescope client
-        with (
-            patch("seestar_mcp.server._telescope_client", None),
-            patch(
-                "seestar_mcp.server.SeestarClient", return_value=mock_telescope_client
-            ),
-        ):
+        monkeypatch.setattr(
+            "seestar_mcp.server.SeestarClient.get",
+            AsyncMock(return_value=mock_telescope_client),
+        )
 
-            # Get the connect_telescope tool
-            tools = await server._list_tools()
-            connect_tool = next(
-                tool for tool in tools if tool.name == "connect_telescope"
-            )
+        connect_tool = tools_by_name["connect_telescope"]
 
-            # Call the tool
-            result = await connect_tool.fn(
-                host="192.168.1.100", port=4700, timeout=30.0, ctx=mock_context
-            )
+        # Call the tool
+        result = await connect_tool.fn(
+            host="192.168.1.100", port=4700, timeout=30.0, ctx=mock_context
+        )
 
-            assert result.success is True
-            assert "Successfully connected" in result.message
-            mock_telescope_client.connect.assert_called_once()
+        assert result.success is True
+        assert "Successfully connected" in result.message
+        mock_telescope_client.connect.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_connect_telescope_failure(self, mock_context):
+    @pytest.mark.no_client
+    async def test_connect_telescope_failure(
+        self, monkeypatch, tools_by_name, mock_context
+    ):
         """Test telescope connection failure."""
-        server = create_server()
-
         # Mock failed connection
         mock_client = AsyncMock()
+        mock_client.is_connected = False
         mock_client.connect.return_value = False
 
-        with (
-            patch("seestar_mcp.server._telescope_client", None),
-            patch("seestar_mcp.server.SeestarClient", return_value=mock_client),
-        ):
-
-            tools = await server._list_tools()
-            connect_tool = next(
-                tool for tool in tools if tool.name == "connect_telescope"
-            )
+        monkeypatch.setattr(
+            "seestar_mcp.server.SeestarClient.get", AsyncMock(return_value=mock_client)
+        )
 
-            # Should raise ToolError
-            with pytest.raises(Exception):  # ToolError
-                await connect_tool.fn(
-                    host="192.168.1.999", port=4700, timeout=30.0, ctx=mock_context
-                )
+        connect_tool = tools_by_name["connect_telescope"]
 
-    @pytest.mark.asyncio
-    async def test_disconnect_telescope(self, mock_telescope_client, mock_context):
-        """Test telescope disconnection."""
-        server = create_server()
+        # Should raise ToolError
+        with pytest.raises(Exception):  # ToolError
+            await connect_tool.fn(
+                host="192.168.1.999", port=4700, timeout=30.0, ctx=mock_context
+            )
 
-        with patch("seestar_mcp.server._telescope_client", mock_telescope_client):
+    async def test_connect_telescope_reuses_connection(
+        self, monkeypatch, tools_by_name, mock_telescope_client, mock_context
+    ):
+        """Test connecting again to a connected telescope reuses its session."""
+        monkeypatch.setattr(
+            "seestar_mcp.server.SeestarClient.get",
+            AsyncMock(return_value=mock_telescope_client),
+        )
 
-            tools = await server._list_tools()
-            disconnect_tool = next(
-                tool for tool in tools if tool.name == "disconnect_telescope"
-            )
+        connect_tool = tools_by_name["connect_telescope"]
 
-            result = await disconnect_tool.fn(ctx=mock_context)
+        result = await connect_tool.fn(
+            host="192.168.1.100", port=4700, timeout=30.0, ctx=mock_context
+        )
 
-            assert result.success is True
-            assert "Disconnected" in result.message
-            mock_telescope_client.disconnect.assert_called_once()
+        assert result.success is True
+        mock_telescope_client.connect.assert_not_called()
+        mock_telescope_client.disconnect.assert_not_called()
 
-    @pytest.mark.asyncio
     async def test_get_telescope_status(
-        self, mock_telescope_client, mock_telescope_state, mock_context
+        self,
+        tools_by_name,
+        mock_telescope_client,
+        mock_telescope_state,
+        mock_context,
     ):
         """Test getting telescope status."""
-        server = create_server()
-
         mock_telescope_client.get_status.return_value = mock_telescope_state
 
-        with patch("seestar_mcp.server._telescope_client", mock_telescope_client):
+        status_tool = tools_by_name["get_telescope_status"]
 
-            tools = await server._list_tools()
-            status_tool = next(
-                tool for tool in tools if tool.name == "get_telescope_status"
-            )
-
-            result = await status_tool.fn(ctx=mock_context)
+        result = await status_tool.fn(ctx=mock_context)
 
-            assert result.success is True
-            assert result.telescope_state is not None
-            assert result.telescope_state.status == TelescopeStatus.IDLE
+        assert result.success is True
+        assert result.telescope_state is not None
+        assert result.telescope_state.status == TelescopeStatus.IDLE
 
-    @pytest.mark.asyncio
-    async def test_get_telescope_status_not_connected(self, mock_context):
+    @pytest.mark.no_client
+    async def test_get_telescope_status_not_connected(
+        self, tools_by_name, mock_context
+    ):
         """Test getting status when not connected."""
-        server = create_server()
-
-        with patch("seestar_mcp.server._telescope_client", None):
-
-            tools = await server._list_tools()
-            status_tool = next(
-                tool for tool in tools if tool.name == "get_telescope_status"
-            )
+        status_tool = tools_by_name["get_telescope_status"]
 
-            with pytest.raises(Exception):  # ToolError
-                await status_tool.fn(ctx=mock_context)
+        with pytest.raises(Exception):  # ToolError
+            await status_tool.fn(ctx=mock_context)
 
-    @pytest.mark.asyncio
     async def test_goto_target_success(
         self,
+        monkeypatch,
+        tools_by_name,
         mock_telescope_client,
         mock_target_resolver,
         mock_target,
@@ -147,234 +159,145 @@ class TestMCPServer:
         mock_context,
     ):
         """Test successful goto target."""
-        server = create_server()
-
         mock_telescope_client.goto_coordinates.return_value = True
         mock_telescope_client.get_status.return_value = mock_telescope_state
 
-        with (
-            patch("seestar_mcp.server._telescope_client", mock_telescope_client),
-            patch("seestar_mcp.server._target_resolver", mock_target_resolver),
-        ):
+        monkeypatch.setattr("seestar_mcp.server._target_resolver", mock_target_resolver)
 
-            tools = await server._list_tools()
-            goto_tool = next(tool for tool in tools if tool.name == "goto_target")
+        goto_tool = tools_by_name["goto_target"]
 
-            result = await goto_tool.fn(target_name="M31", ctx=mock_context)
+        result = await goto_tool.fn(target_name="M31", ctx=mock_context)
 
-            assert result.success is True
-            assert "Slewing to" in result.message
-            assert result.data["target"]["name"] == "M31"
-            mock_telescope_client.goto_coordinates.assert_called_once()
+        assert result.success is True
+        assert "Slewing to" in result.message
+        assert result.data["target"]["name"] == "M31"
+        mock_telescope_client.goto_coordinates.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_goto_target_not_found(self, mock_telescope_client, mock_context):
+    async def test_goto_target_not_found(
+        self, monkeypatch, tools_by_name, mock_telescope_client, mock_context
+    ):
         """Test goto target when target not found."""
-        server = create_server()
-
         # Mock target resolver that doesn't find target
         mock_resolver = AsyncMock()
-        from seestar_mcp.models import TargetSearchResult
-
         mock_resolver.resolve_target.return_value = TargetSearchResult(
             found=False, alternatives=["M31", "M42"], search_query="NonExistent"
         )
 
-        with (
-            patch("seestar_mcp.server._telescope_client", mock_telescope_client),
-            patch("seestar_mcp.server._target_resolver", mock_resolver),
-        ):
-
-            tools = await server._list_tools()
-            goto_tool = next(tool for tool in tools if tool.name == "goto_target")
-
-            with pytest.raises(Exception):  # ToolError
-                await goto_tool.fn(target_name="NonExistent", ctx=mock_context)
+        monkeypatch.setattr("seestar_mcp.server._target_resolver", mock_resolver)
 
-    @pytest.mark.asyncio
-    async def test_start_imaging(
-        self, mock_telescope_client, mock_imaging_state, mock_context
-    ):
-        """Test starting imaging session."""
-        server = create_server()
-
-        mock_telescope_client.start_imaging.return_value = True
-        mock_telescope_client.get_imaging_status.return_value = mock_imaging_state
+        goto_tool = tools_by_name["goto_target"]
 
-        with patch("seestar_mcp.server._telescope_client", mock_telescope_client):
+        with pytest.raises(Exception):  # ToolError
+            await goto_tool.fn(target_name="NonExistent", ctx=mock_context)
 
-            tools = await server._list_tools()
-            imaging_tool = next(tool for tool in tools if tool.name == "start_imaging")
-
-            result = await imaging_tool.fn(
-                exposure_time=120.0, count=10, gain=100, binning=1, ctx=mock_context
-            )
-
-            assert result.success is True
-            assert "Started imaging" in result.message
-            mock_telescope_client.start_imaging.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_stop_imaging(
-        self, mock_telescope_client, mock_imaging_state, mock_context
-    ):
-        """Test stopping imaging session."""
-        server = create_server()
-
-        mock_telescope_client.stop_imaging.return_value = True
-        mock_telescope_client.get_imaging_status.return_value = mock_imaging_state
-
-        with patch("seestar_mcp.server._telescope_client", mock_telescope_client):
-
-            tools = await server._list_tools()
-            stop_tool = next(tool for tool in tools if tool.name == "stop_imaging")
-
-            result = await stop_tool.fn(ctx=mock_context)
-
-            assert result.success is True
-            assert "stopped" in result.message
-            mock_telescope_client.stop_imaging.assert_called_once()
-
-    @pytest.mark.asyncio
     async def test_get_imaging_status(
-        self, mock_telescope_client, mock_imaging_state, mock_context
+        self,
+        tools_by_name,
+        mock_telescope_client,
+        mock_imaging_state,
+        mock_context,
     ):
         """Test getting imaging status."""
-        server = create_server()
-
-        mock_imaging_state.status = ImagingStatus.RUNNING
-        mock_imaging_state.progress = 50
-        mock_telescope_client.get_imaging_status.return_value = mock_imaging_state
-
-        with patch("seestar_mcp.server._telescope_client", mock_telescope_client):
-
-            tools = await server._list_tools()
-            status_tool = next(
-                tool for tool in tools if tool.name == "get_imaging_status"
-            )
-
-            result = await status_tool.fn(ctx=mock_context)
-
-            assert result.success is True
-            assert result.imaging_state.status == ImagingStatus.RUNNING
-            assert result.imaging_state.progress == 50
-
-    @pytest.mark.asyncio
-    async def test_start_calibration(
-        self, mock_telescope_client, mock_calibration_state, mock_context
-    ):
-        """Test starting calibration."""
-        server = create_server()
-
-        mock_telescope_client.start_calibration.return_value = True
-        mock_telescope_client.get_calibration_status.return_value = (
-            mock_calibration_state
+        mock_imaging_state = mock_imaging_state.model_copy(
+            update={"status": ImagingStatus.RUNNING, "progress": 50}
         )
+        mock_telescope_client.get_imaging_status.return_value = mock_imaging_state
 
-        with patch("seestar_mcp.server._telescope_client", mock_telescope_client):
-
-            tools = await server._list_tools()
-            cal_tool = next(tool for tool in tools if tool.name == "start_calibration")
-
-            result = await cal_tool.fn(ctx=mock_context)
-
-            assert result.success is True
-            assert "Calibration sequence started" in result.message
-            mock_telescope_client.start_calibration.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_park_telescope(
-        self, mock_telescope_client, mock_telescope_state, mock_context
-    ):
-        """Test parking telescope."""
-        server = create_server()
-
-        mock_telescope_client.park_telescope.return_value = True
-        mock_telescope_client.get_status.return_value = mock_telescope_state
-
-        with patch("seestar_mcp.server._telescope_client", mock_telescope_client):
-
-            tools = await server._list_tools()
-            park_tool = next(tool for tool in tools if tool.name == "park_telescope")
+        status_tool = tools_by_name["get_imaging_status"]
 
-            result = await park_tool.fn(ctx=mock_context)
+        result = await status_tool.fn(ctx=mock_context)
 
-            assert result.success is True
-            assert "parked successfully" in result.message
-            mock_telescope_client.park_telescope.assert_called_once()
+        assert result.success is True
+        assert result.imaging_state.status == ImagingStatus.RUNNING
+        assert result.imaging_state.progress == 50
 
-    @pytest.mark.asyncio
-    async def test_unpark_telescope(
-        self, mock_telescope_client, mock_telescope_state, mock_context
+    async def test_search_target(
+        self,
+        monkeypatch,
+        tools_by_name,
+        mock_target_resolver,
+        mock_target,
+        mock_context,
     ):
-        """Test unparking telescope."""
-        server = create_server()
-
-        mock_telescope_client.unpark_telescope.return_value = True
-        mock_telescope_client.get_status.return_value = mock_telescope_state
-
-        with patch("seestar_mcp.server._telescope_client", mock_telescope_client):
-
-            tools = await server._list_tools()
-            unpark_tool = next(
-                tool for tool in tools if tool.name == "unpark_telescope"
-            )
-
-            result = await unpark_tool.fn(ctx=mock_context)
-
-            assert result.success is True
-            assert "unparked successfully" in result.message
-            mock_telescope_client.unpark_telescope.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_search_target(self, mock_target_resolver, mock_target, mock_context):
         """Test target search."""
-        server = create_server()
-
-        with patch("seestar_mcp.server._target_resolver", mock_target_resolver):
+        monkeypatch.setattr("seestar_mcp.server._target_resolver", mock_target_resolver)
 
-            tools = await server._list_tools()
-            search_tool = next(tool for tool in tools if tool.name == "search_target")
+        search_tool = tools_by_name["search_target"]
 
-            result = await search_tool.fn(target_name="M31", ctx=mock_context)
+        result = await search_tool.fn(target_name="M31", ctx=mock_context)
 
-            assert result.found is True
-            assert result.target.name == "M31"
+        assert result.found is True
+        assert result.target.name == "M31"
 
-    @pytest.mark.asyncio
     async def test_get_system_info(
-        self, mock_telescope_client, mock_telescope_info, mock_context
+        self,
+        tools_by_name,
+        mock_telescope_client,
+        mock_telescope_info,
+        mock_context,
     ):
         """Test getting system info."""
-        server = create_server()
-
         mock_telescope_client._telescope_info = mock_telescope_info
 
-        with patch("seestar_mcp.server._telescope_client", mock_telescope_client):
+        info_tool = tools_by_name["get_system_info"]
 
-            tools = await server._list_tools()
-            info_tool = next(tool for tool in tools if tool.name == "get_system_info")
+        result = await info_tool.fn(ctx=mock_context)
 
-            result = await info_tool.fn(ctx=mock_context)
+        assert result.mcp_server_version is not None
+        assert result.connection_status is True
+        assert result.telescope_info == mock_telescope_info
 
-            assert result.mcp_server_version is not None
-            assert result.connection_status is True
-            assert result.telescope_info == mock_telescope_info
-
-    @pytest.mark.asyncio
-    async def test_emergency_stop(self, mock_telescope_client, mock_context):
-        """Test emergency stop."""
-        server = create_server()
-
-        mock_telescope_client.emergency_stop.return_value = True
-
-        with patch("seestar_mcp.server._telescope_client", mock_telescope_client):
-
-            tools = await server._list_tools()
-            stop_tool = next(tool for tool in tools if tool.name == "emergency_stop")
+    @pytest.mark.parametrize(
+        "tool_name, kwargs, client_method, expected_message",
+        [
+            ("disconnect_telescope", {}, "disconnect", "Disconnected"),
+            (
+                "start_imaging",
+                {"exposure_time": 120.0, "count": 10, "gain": 100, "binning": 1},
+                "start_imaging",
+                "Started imaging",
+            ),
+            ("stop_imaging", {}, "stop_imaging", "stopped"),
+            (
+                "start_calibration",
+                {},
+                "start_calibration",
+                "Calibration sequence started",
+            ),
+            ("park_telescope", {}, "park_telescope", "parked successfully"),
+            ("unpark_telescope", {}, "unpark_telescope", "unparked successfully"),
+            ("emergency_stop", {}, "emergency_stop", "Emergency stop executed"),
+        ],
+        ids=[
+            "disconnect",
+            "start_imaging",
+            "stop_imaging",
+            "start_calibration",
+            "park",
+            "unpark",
+            "emergency_stop",
+        ],
+    )
+    async def test_tool_success(
+        self,
+        tools_by_name,
+        mock_telescope_client,
+        mock_imaging_state,
+        mock_calibration_state,
+        mock_context,
+        tool_name,
+        kwargs,
+        client_method,
+        expected_message,
+    ):
+        """Test tools that forward a single command to the connected telescope."""
+        mock_telescope_client.get_imaging_status.return_value = mock_imaging_state
+        mock_telescope_client.get_calibration_status.return_value = (
+            mock_calibration_state
+        )
 
-            result = await stop_tool.fn(ctx=mock_context)
+        result = await tools_by_name[tool_name].fn(**kwargs, ctx=mock_context)
 
-            assert result.success is True
-            assert "Emergency stop executed" in result.message
-            mock_telescope_client.emergency_stop.assert_called_once()
+        assert result.success is True
+        assert expected_message in result.message
+        getattr(mock_telescope_client, client_method).assert_called_once()
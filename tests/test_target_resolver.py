@@ -1,29 +1,77 @@
 """Tests for TargetResolver astronomical target resolution."""
 
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, Mock
 
+import httpx
 import pytest
+from astropy import units as u
+from astropy.coordinates import SkyCoord
 
 from seestar_mcp.models import Coordinates, Target, TargetSearchResult
-from seestar_mcp.target_resolver import TargetResolver, format_coordinates
+from seestar_mcp.target_resolver import (
+    TargetResolver,
+    _build_simbad_url,
+    format_coordinates,
+)
+
+# Keep these tests on one xdist worker so the module-scoped resolver and the
+# session-scoped fixtures are built once
+pytestmark = pytest.mark.xdist_group("target_resolver")
+
+# Cache entries shared by the cache tests; models are frozen, so reuse is safe
+_M31 = Target(
+    name="M31",
+    coordinates=Coordinates(ra=0.712, dec=41.269, epoch="J2000"),
+    magnitude=3.4,
+    object_type="galaxy",
+)
+_M42 = Target(name="M42", coordinates=Coordinates(ra=5.588, dec=-5.389))
+
+# Positions returned by the patched get_sun/get_body, built once per module
+_SUN_COORD = SkyCoord(ra=150.0 * u.deg, dec=20.0 * u.deg)
+_MOON_COORD = SkyCoord(ra=180.0 * u.deg, dec=-10.0 * u.deg)
+_MARS_COORD = SkyCoord(ra=30.0 * u.deg, dec=15.0 * u.deg)
+
+# SIMBAD replies shared by the SIMBAD tests (RA is in degrees)
+_SIMBAD_M31_RESP = httpx.Response(
+    200, json={"data": [["M31", 10.68, 41.269, "galaxy", 3.4]]}
+)
+_SIMBAD_EMPTY_RESP = httpx.Response(200, json={"data": []})
+_SIMBAD_500_RESP = httpx.Response(500)
+
+# Answers every request with an empty SIMBAD result, without opening sockets
+_MOCK_TRANSPORT = httpx.MockTransport(
+    lambda request: httpx.Response(200, json={"data": []})
+)
+
+
+@pytest.fixture(scope="module")
+async def shared_resolver():
+    """TargetResolver built once for the module, on the in-memory transport."""
+    async with httpx.AsyncClient(transport=_MOCK_TRANSPORT, trust_env=False) as session:
+        yield TargetResolver(session=session)
+
+
+@pytest.fixture
+def resolver(shared_resolver):
+    """The module's TargetResolver, with its cache cleared after each test."""
+    yield shared_resolver
+    shared_resolver.clear_cache()
+
+
+@pytest.fixture
+def simbad_resolver(mock_http_session):
+    """TargetResolver querying SIMBAD through the mock HTTP session."""
+    return TargetResolver(session=mock_http_session)
 
 
 class TestTargetResolver:
     """Test cases for TargetResolver."""
 
-    @pytest.mark.asyncio
-    async def test_resolve_target_cached(self):
+    async def test_resolve_target_cached(self, resolver):
         """Test resolving a cached target."""
-        resolver = TargetResolver()
-
         # Add target to cache
-        target = Target(
-            name="M31",
-            coordinates=Coordinates(ra=0.712, dec=41.269, epoch="J2000"),
-            magnitude=3.4,
-            object_type="galaxy",
-        )
-        resolver._cache["m31"] = target
+        resolver._cache["m31"] = _M31
 
         result = await resolver.resolve_target("M31")
 
@@ -31,156 +79,135 @@ class TestTargetResolver:
         assert result.target.name == "M31"
         assert result.search_query == "M31"
 
-    @pytest.mark.asyncio
-    async def test_resolve_target_not_found(self):
+    async def test_resolve_target_not_found(self, resolver, monkeypatch):
         """Test resolving a target that doesn't exist."""
-        resolver = TargetResolver()
-
         # Mock both resolution methods to fail
-        with (
-            patch.object(resolver, "_resolve_with_astropy", return_value=None),
-            patch.object(resolver, "_resolve_with_simbad", return_value=None),
-            patch.object(
-                resolver, "_find_alternatives", return_value=["M31", "Andromeda"]
-            ),
-        ):
+        monkeypatch.setattr(
+            resolver, "_resolve_with_astropy", AsyncMock(return_value=None)
+        )
+        monkeypatch.setattr(
+            resolver, "_resolve_with_simbad", AsyncMock(return_value=None)
+        )
+        monkeypatch.setattr(
+            resolver,
+            "_find_alternatives",
+            AsyncMock(return_value=["M31", "Andromeda"]),
+        )
+
+        result = await resolver.resolve_target("NonExistentTarget")
+
+        assert result.found is False
+        assert result.alternatives == ["M31", "Andromeda"]
+        assert result.search_query == "NonExistentTarget"
 
-            result = await resolver.resolve_target("NonExistentTarget")
+    async def test_resolve_target_with_astropy(self, resolver, monkeypatch):
+        """Test a target found by Astropy is returned and cached."""
 
-            assert result.found is False
-            assert result.alternatives == ["M31", "Andromeda"]
-            assert result.search_query == "NonExistentTarget"
+        async def resolve_with_astropy(name):
+            return _M31
 
-    @pytest.mark.asyncio
-    async def test_resolve_with_astropy_success(self):
-        """Test successful Astropy resolution."""
-        resolver = TargetResolver()
+        monkeypatch.setattr(resolver, "_resolve_with_astropy", resolve_with_astropy)
 
+        result = await resolver.resolve_target("Andromeda")
+
+        assert result.found is True
+        assert result.target is _M31
+        assert resolver._cache["andromeda"] is _M31
+
+    async def test_resolve_with_astropy_success(self, resolver, monkeypatch):
+        """Test successful Astropy resolution through the executor."""
         # Mock astropy coordinate resolution
         mock_coord = Mock()
         mock_coord.ra.hour = 0.712
         mock_coord.dec.degree = 41.269
 
-        with (
-            patch(
-                "seestar_mcp.target_resolver.get_icrs_coordinates",
-                return_value=mock_coord,
-            ),
-            patch("asyncio.get_event_loop") as mock_loop,
-        ):
-
-            mock_executor = AsyncMock()
-            mock_executor.return_value = mock_coord
-            mock_loop.return_value.run_in_executor = mock_executor
+        monkeypatch.setattr(
+            "seestar_mcp.target_resolver.get_icrs_coordinates",
+            lambda name: mock_coord,
+        )
 
-            target = await resolver._resolve_with_astropy("M31")
+        target = await resolver._resolve_with_astropy("M31")
 
-            assert target is not None
-            assert target.name == "M31"
-            assert target.coordinates.ra == 0.712
-            assert target.coordinates.dec == 41.269
+        assert target is not None
+        assert target.name == "M31"
+        assert target.coordinates.ra == 0.712
+        assert target.coordinates.dec == 41.269
 
-    @pytest.mark.asyncio
-    async def test_resolve_with_astropy_failure(self):
+    async def test_resolve_with_astropy_failure(self, resolver, monkeypatch):
         """Test Astropy resolution failure."""
-        resolver = TargetResolver()
-
-        with (
-            patch(
-                "seestar_mcp.target_resolver.get_icrs_coordinates",
-                side_effect=Exception("Not found"),
-            ),
-            patch("asyncio.get_event_loop") as mock_loop,
-        ):
-
-            mock_executor = AsyncMock(side_effect=Exception("Not found"))
-            mock_loop.return_value.run_in_executor = mock_executor
+        monkeypatch.setattr(
+            "seestar_mcp.target_resolver.get_icrs_coordinates",
+            Mock(side_effect=Exception("Not found")),
+        )
 
-            target = await resolver._resolve_with_astropy("NonExistent")
+        target = await resolver._resolve_with_astropy("NonExistent")
 
-            assert target is None
+        assert target is None
 
-    @pytest.mark.asyncio
-    async def test_resolve_with_simbad_success(self):
+    async def test_resolve_with_simbad_success(
+        self, simbad_resolver, mock_http_session
+    ):
         """Test successful SIMBAD resolution."""
-        resolver = TargetResolver()
-
         # Mock httpx client
-        mock_session = AsyncMock()
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": [["M31", 10.68, 41.269, "galaxy", 3.4]]  # RA in degrees
-        }
-        mock_session.get.return_value = mock_response
-        resolver.session = mock_session
+        mock_http_session.get.return_value = _SIMBAD_M31_RESP
 
-        target = await resolver._resolve_with_simbad("M31")
+        target = await simbad_resolver._resolve_with_simbad("M31")
 
         assert target is not None
         assert target.name == "M31"
-        assert target.coordinates.ra == pytest.approx(0.712, rel=1e-2)  # 10.68/15
+        assert abs(target.coordinates.ra - 0.712) < 0.008  # 10.68/15
         assert target.coordinates.dec == 41.269
         assert target.object_type == "galaxy"
         assert target.magnitude == 3.4
 
-    @pytest.mark.asyncio
-    async def test_resolve_with_simbad_not_found(self):
+    async def test_resolve_with_simbad_not_found(
+        self, simbad_resolver, mock_http_session
+    ):
         """Test SIMBAD resolution when target not found."""
-        resolver = TargetResolver()
-
         # Mock httpx client with empty result
-        mock_session = AsyncMock()
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": []}
-        mock_session.get.return_value = mock_response
-        resolver.session = mock_session
+        mock_http_session.get.return_value = _SIMBAD_EMPTY_RESP
 
-        target = await resolver._resolve_with_simbad("NonExistent")
+        target = await simbad_resolver._resolve_with_simbad("NonExistent")
 
         assert target is None
 
-    @pytest.mark.asyncio
-    async def test_resolve_with_simbad_error(self):
+    async def test_resolve_with_simbad_error(self, simbad_resolver, mock_http_session):
         """Test SIMBAD resolution with HTTP error."""
-        resolver = TargetResolver()
-
         # Mock httpx client with error
-        mock_session = AsyncMock()
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_session.get.return_value = mock_response
-        resolver.session = mock_session
+        mock_http_session.get.return_value = _SIMBAD_500_RESP
 
-        target = await resolver._resolve_with_simbad("M31")
+        target = await simbad_resolver._resolve_with_simbad("M31")
 
         assert target is None
 
-    @pytest.mark.asyncio
-    async def test_find_alternatives_messier(self):
-        """Test finding alternatives for Messier objects."""
-        resolver = TargetResolver()
+    async def test_simbad_url_cached(self, simbad_resolver, mock_http_session):
+        """Test that repeated SIMBAD lookups reuse the built query URL."""
+        _build_simbad_url.cache_clear()
+        mock_http_session.get.return_value = _SIMBAD_EMPTY_RESP
 
+        await simbad_resolver._resolve_with_simbad("M31")
+        await simbad_resolver._resolve_with_simbad("M31")
+
+        assert _build_simbad_url.cache_info().hits == 1
+        url = httpx.URL(mock_http_session.get.call_args.args[0])
+        assert url.params["format"] == "json"
+        assert "WHERE main_id = 'M31'" in url.params["query"]
+
+    async def test_find_alternatives_messier(self, resolver):
+        """Test finding alternatives for Messier objects."""
         alternatives = await resolver._find_alternatives("M31")
 
         assert "Messier 31" in alternatives
         assert "NGC 224" in alternatives  # M31 = NGC 224
 
-    @pytest.mark.asyncio
-    async def test_find_alternatives_ngc(self):
+    async def test_find_alternatives_ngc(self, resolver):
         """Test finding alternatives for NGC objects."""
-        resolver = TargetResolver()
-
         alternatives = await resolver._find_alternatives("NGC 224")
 
         assert "M31" in alternatives  # NGC 224 = M31
 
-    @pytest.mark.asyncio
-    async def test_find_alternatives_general(self):
+    async def test_find_alternatives_general(self, resolver):
         """Test finding alternatives for general objects (should return empty for non-catalog objects)."""
-        resolver = TargetResolver()
-
         # Non-catalog objects should return empty alternatives
         alternatives = await resolver._find_alternatives("test object")
         assert alternatives == []
@@ -193,32 +220,27 @@ class TestTargetResolver:
         alternatives = await resolver._find_alternatives("NGC 224")
         assert any("M" in alt for alt in alternatives)
 
-    def test_messier_to_ngc(self):
+    @pytest.mark.parametrize(
+        "messier, ngc", [(31, 224), (42, 1976), (999, None)], ids=["M31", "M42", "none"]
+    )
+    def test_messier_to_ngc(self, resolver, messier, ngc):
         """Test Messier to NGC conversion."""
-        resolver = TargetResolver()
-
-        assert resolver._messier_to_ngc(31) == 224
-        assert resolver._messier_to_ngc(42) == 1976
-        assert resolver._messier_to_ngc(999) is None  # Non-existent
-
-    def test_ngc_to_messier(self):
+        assert resolver._messier_to_ngc(messier) == ngc
+
+    @pytest.mark.parametrize(
+        "ngc, messier",
+        [(224, 31), (1976, 42), (999999, None)],
+        ids=["NGC224", "NGC1976", "none"],
+    )
+    def test_ngc_to_messier(self, resolver, ngc, messier):
         """Test NGC to Messier conversion."""
-        resolver = TargetResolver()
-
-        assert resolver._ngc_to_messier(224) == 31
-        assert resolver._ngc_to_messier(1976) == 42
-        assert resolver._ngc_to_messier(999999) is None  # Non-existent
+        assert resolver._ngc_to_messier(ngc) == messier
 
-    def test_get_cached_targets(self):
+    def test_get_cached_targets(self, resolver):
         """Test getting cached target names."""
-        resolver = TargetResolver()
-
         # Add some targets to cache
-        target1 = Target(name="M31", coordinates=Coordinates(ra=0.712, dec=41.269))
-        target2 = Target(name="M42", coordinates=Coordinates(ra=5.588, dec=-5.389))
-
-        resolver._cache["m31"] = target1
-        resolver._cache["m42"] = target2
+        resolver._cache["m31"] = _M31
+        resolver._cache["m42"] = _M42
 
         cached = resolver.get_cached_targets()
 
@@ -226,13 +248,10 @@ class TestTargetResolver:
         assert "m42" in cached
         assert len(cached) == 2
 
-    def test_clear_cache(self):
+    def test_clear_cache(self, resolver):
         """Test clearing the target cache."""
-        resolver = TargetResolver()
-
         # Add target to cache
-        target = Target(name="M31", coordinates=Coordinates(ra=0.712, dec=41.269))
-        resolver._cache["m31"] = target
+        resolver._cache["m31"] = _M31
 
         assert len(resolver._cache) == 1
 
@@ -240,7 +259,6 @@ class TestTargetResolver:
 
         assert len(resolver._cache) == 0
 
-    @pytest.mark.asyncio
     async def test_async_context_manager(self):
         """Test using TargetResolver as async context manager."""
         async with TargetResolver() as resolver:
@@ -248,110 +266,86 @@ class TestTargetResolver:
 
         # Session should be closed after exiting context
 
-    @pytest.mark.asyncio
-    async def test_resolve_solar_system_objects(self):
-        """Test resolving solar system objects."""
-        resolver = TargetResolver()
-
-        # Mock astropy functions to return expected coordinates
-        from astropy import units as u
-        from astropy.coordinates import SkyCoord
+    async def test_async_context_manager_injected_session(self, mock_http_session):
+        """Test an injected session is used as is and left open on exit."""
+        async with TargetResolver(session=mock_http_session) as resolver:
+            assert resolver.session is mock_http_session
 
-        mock_sun_coord = SkyCoord(ra=150.0 * u.deg, dec=20.0 * u.deg)
-        mock_moon_coord = SkyCoord(ra=180.0 * u.deg, dec=-10.0 * u.deg)
+        mock_http_session.aclose.assert_not_called()
 
-        with patch("seestar_mcp.target_resolver.get_sun", return_value=mock_sun_coord):
-            result = await resolver.resolve_target("sun")
+    async def test_resolve_solar_system_objects(self, resolver, monkeypatch):
+        """Test resolving solar system objects."""
+        monkeypatch.setattr(
+            "seestar_mcp.target_resolver.get_sun", lambda *args, **kwargs: _SUN_COORD
+        )
+        result = await resolver.resolve_target("sun")
 
-            assert result.found is True
-            assert result.target is not None
-            assert "Sun" in result.target.name
-            assert "SOLAR OBSERVATION" in result.target.name
-            assert result.target.object_type == "Star"
-            assert result.target.magnitude == -26.7
-            assert abs(result.target.coordinates.ra - 10.0) < 0.1  # 150°/15 = 10h
-            assert abs(result.target.coordinates.dec - 20.0) < 0.1
-
-        with patch(
-            "seestar_mcp.target_resolver.get_body", return_value=mock_moon_coord
-        ):
-            result = await resolver.resolve_target("moon")
+        assert result.found is True
+        assert result.target is not None
+        assert "Sun" in result.target.name
+        assert "SOLAR OBSERVATION" in result.target.name
+        assert result.target.object_type == "Star"
+        assert result.target.magnitude == -26.7
+        assert abs(result.target.coordinates.ra - 10.0) < 0.1  # 150°/15 = 10h
+        assert abs(result.target.coordinates.dec - 20.0) < 0.1
+
+        monkeypatch.setattr(
+            "seestar_mcp.target_resolver.get_body", lambda *args, **kwargs: _MOON_COORD
+        )
+        result = await resolver.resolve_target("moon")
 
-            assert result.found is True
-            assert result.target is not None
-            assert result.target.name == "Moon"
-            assert result.target.object_type == "Satellite"
-            assert result.target.magnitude == -12.9
-            assert abs(result.target.coordinates.ra - 12.0) < 0.1  # 180°/15 = 12h
-            assert abs(result.target.coordinates.dec - (-10.0)) < 0.1
-
-    @pytest.mark.asyncio
-    async def test_resolve_planets(self):
+        assert result.found is True
+        assert result.target is not None
+        assert result.target.name == "Moon"
+        assert result.target.object_type == "Satellite"
+        assert result.target.magnitude == -12.9
+        assert abs(result.target.coordinates.ra - 12.0) < 0.1  # 180°/15 = 12h
+        assert abs(result.target.coordinates.dec - (-10.0)) < 0.1
+
+    async def test_resolve_planets(self, resolver, monkeypatch):
         """Test resolving planets."""
-        resolver = TargetResolver()
-
-        from astropy import units as u
-        from astropy.coordinates import SkyCoord
-
-        mock_mars_coord = SkyCoord(ra=30.0 * u.deg, dec=15.0 * u.deg)
-
-        with patch(
-            "seestar_mcp.target_resolver.get_body", return_value=mock_mars_coord
-        ):
-            result = await resolver.resolve_target("mars")
+        monkeypatch.setattr(
+            "seestar_mcp.target_resolver.get_body", lambda *args, **kwargs: _MARS_COORD
+        )
+        result = await resolver.resolve_target("mars")
 
-            assert result.found is True
-            assert result.target is not None
-            assert result.target.name == "Mars"
-            assert result.target.object_type == "Planet"
-            assert result.target.magnitude == -2.9
-            assert abs(result.target.coordinates.ra - 2.0) < 0.1  # 30°/15 = 2h
-            assert abs(result.target.coordinates.dec - 15.0) < 0.1
-
-    @pytest.mark.asyncio
-    async def test_solar_system_case_insensitive(self):
+        assert result.found is True
+        assert result.target is not None
+        assert result.target.name == "Mars"
+        assert result.target.object_type == "Planet"
+        assert result.target.magnitude == -2.9
+        assert abs(result.target.coordinates.ra - 2.0) < 0.1  # 30°/15 = 2h
+        assert abs(result.target.coordinates.dec - 15.0) < 0.1
+
+    async def test_solar_system_case_insensitive(self, resolver, monkeypatch):
         """Test that solar system object resolution is case insensitive."""
-        resolver = TargetResolver()
-
-        from astropy import units as u
-        from astropy.coordinates import SkyCoord
-
-        mock_coord = SkyCoord(ra=45.0 * u.deg, dec=30.0 * u.deg)
-
-        with patch("seestar_mcp.target_resolver.get_body", return_value=mock_coord):
-            # Test different cases
-            for name in ["jupiter", "JUPITER", "Jupiter", "JuPiTeR"]:
-                result = await resolver.resolve_target(name)
-                assert result.found is True
-                assert result.target.name == "Jupiter"
+        monkeypatch.setattr(
+            "seestar_mcp.target_resolver.get_body", lambda *args, **kwargs: _MARS_COORD
+        )
+        # Test different cases
+        for name in ["jupiter", "JUPITER", "Jupiter", "JuPiTeR"]:
+            result = await resolver.resolve_target(name)
+            assert result.found is True
+            assert result.target.name == "Jupiter"
 
-    @pytest.mark.asyncio
-    async def test_solar_system_object_not_cached(self):
+    async def test_solar_system_object_not_cached(self, resolver, monkeypatch):
         """Test that solar system objects are not cached (positions change)."""
-        resolver = TargetResolver()
-
-        from astropy import units as u
-        from astropy.coordinates import SkyCoord
-
-        mock_coord = SkyCoord(ra=60.0 * u.deg, dec=45.0 * u.deg)
-
-        with patch("seestar_mcp.target_resolver.get_sun", return_value=mock_coord):
-            # Resolve sun twice
-            result1 = await resolver.resolve_target("sun")
-            result2 = await resolver.resolve_target("sun")
+        monkeypatch.setattr(
+            "seestar_mcp.target_resolver.get_sun", lambda *args, **kwargs: _SUN_COORD
+        )
+        # Resolve sun twice
+        result1 = await resolver.resolve_target("sun")
+        result2 = await resolver.resolve_target("sun")
 
-            assert result1.found is True
-            assert result2.found is True
+        assert result1.found is True
+        assert result2.found is True
 
-            # Check that sun was not added to cache (solar system objects change position)
-            cached_targets = resolver.get_cached_targets()
-            assert "sun" not in cached_targets
+        # Check that sun was not added to cache (solar system objects change position)
+        cached_targets = resolver.get_cached_targets()
+        assert "sun" not in cached_targets
 
-    @pytest.mark.asyncio
-    async def test_find_alternatives_solar_system(self):
+    async def test_find_alternatives_solar_system(self, resolver):
         """Test that alternatives include solar system objects."""
-        resolver = TargetResolver()
-
         alternatives = await resolver._find_alternatives(
             "su"
         )  # Partial match for "sun"
@@ -366,20 +360,18 @@ class TestTargetResolver:
 class TestCoordinateUtilities:
     """Test coordinate utility functions."""
 
-    def test_format_coordinates(self):
+    @pytest.mark.parametrize(
+        "ra, dec, expected_ra, expected_dec",
+        [
+            (12.5, 35.75, "12h 30m 00.00s", "+35° 45' 00.00\""),
+            (0.712, -5.389, "00h 42m 43.20s", "-05° 23' 20.40\""),
+            (6.0, -0.5, "06h 00m 00.00s", "-00° 30' 00.00\""),
+        ],
+        ids=["positive_dec", "negative_dec", "negative_dec_under_one_degree"],
+    )
+    def test_format_coordinates(self, ra, dec, expected_ra, expected_dec):
         """Test coordinate formatting."""
-        coords = Coordinates(ra=12.5, dec=35.75, epoch="J2000")
-
-        formatted = format_coordinates(coords)
-
-        assert "12h 30m 00.00s" in formatted
-        assert "+35° 45' 00.00\"" in formatted
-
-    def test_format_coordinates_negative_dec(self):
-        """Test formatting negative declination."""
-        coords = Coordinates(ra=0.712, dec=-5.389, epoch="J2000")
-
-        formatted = format_coordinates(coords)
+        formatted = format_coordinates(Coordinates(ra=ra, dec=dec, epoch="J2000"))
 
-        assert "00h 42m 43.20s" in formatted
-        assert "-05° 23' 20.40\"" in formatted
+        assert expected_ra in formatted
+        assert expected_dec in formatted
@@ -3,8 +3,10 @@
 import asyncio
 import json
 import socket
-from unittest.mock import AsyncMock, Mock, patch
+import threading
+from unittest.mock import AsyncMock, Mock, call, patch
 
+import orjson
 import pytest
 
 from seestar_mcp.models import (
@@ -16,26 +18,109 @@ from seestar_mcp.models import (
 )
 from seestar_mcp.telescope_client import SeestarClient, SeestarConnectionError
 
+# Keep these tests on one xdist worker so the class-scoped client and socket
+# are built once
+pytestmark = pytest.mark.xdist_group("telescope_client")
+
+
+# Request models shared by the tests, which only read them
+_COORDS_J2000 = Coordinates(ra=12.5, dec=35.7, epoch="J2000")
+_IMAGING_PARAMS = ImagingParams(exposure_time=120.0, count=10, gain=100, binning=1)
+
+# sendall call expected for _send_message("test message")
+_EXPECTED_SEND = call(b"test message")
+
+
+async def _instant_sleep(*args, **kwargs):
+    """Stand-in for asyncio.sleep in tests that never check how it was called."""
+
+
+# Constructor values of the client attributes tests change, restored in one
+# dict update after each test
+_CLIENT_RESET_STATE = {
+    "timeout": 30.0,
+    "socket": None,
+    "_connected": False,
+    "_is_watch_events": True,
+    "_op_state": "idle",
+    "_telescope_info": None,
+    "_message_thread": None,
+    "_reader_stop": None,
+    "_last_error_details": None,
+}
+
+
+class _FakeSocket:
+    """Socket stand-in whose methods are plain Mocks, without a spec to build."""
+
+    __slots__ = (
+        "settimeout",
+        "gettimeout",
+        "setsockopt",
+        "sendall",
+        "recv",
+        "close",
+        "connect",
+        "shutdown",
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, Mock())
+
+
+def _blocking_socket(client):
+    """Build a fake socket whose recv() blocks until the socket is shut down."""
+    sock = _FakeSocket()
+    shut_down = threading.Event()
+    sock.sendall.side_effect = _ack_frames(client)
+    sock.shutdown.side_effect = lambda how: shut_down.set()
+
+    def recv(bufsize):
+        if not shut_down.wait(5.0):
+            raise socket.timeout
+        raise OSError("Socket shut down")
+
+    sock.recv.side_effect = recv
+    return sock
+
+
+def _ack_frames(client):
+    """Build a sendall side effect that acknowledges every frame at once."""
+
+    def ack(data):
+        for line in data.split(b"\r\n")[:-1]:
+            client._handle_message({"id": orjson.loads(line)["id"], "code": 0})
+
+    return ack
+
 
 class TestSeestarClient:
     """Test SeestarClient functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def client(self):
-        """Create a SeestarClient instance for testing."""
+        """Create a SeestarClient shared by the class and reset after each test."""
         return SeestarClient("192.168.1.100", 4700, 30.0)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_socket(self):
-        """Create a mock socket for testing."""
-        mock_socket = Mock(spec=socket.socket)
-        mock_socket.settimeout = Mock()
-        mock_socket.gettimeout = Mock(return_value=30.0)
-        mock_socket.sendall = Mock()
-        mock_socket.recv = Mock()
-        mock_socket.close = Mock()
+        """Create a mock socket shared by the class and reset after each test."""
+        mock_socket = _FakeSocket()
+        mock_socket.gettimeout.return_value = 30.0
         return mock_socket
 
+    @pytest.fixture(autouse=True)
+    def reset_client(self, client, mock_socket):
+        """Return the shared client and mock socket to their initial state."""
+        yield
+        client.__dict__.update(_CLIENT_RESET_STATE)
+        client._pending.clear()
+        client._move_waiters.clear()
+        for name in _FakeSocket.__slots__:
+            getattr(mock_socket, name).reset_mock(return_value=True, side_effect=True)
+        mock_socket.gettimeout.return_value = 30.0
+
     def test_init(self):
         """Test client initialization."""
         client = SeestarClient("192.168.1.100", 4700, 30.0)
@@ -45,24 +130,116 @@ class TestSeestarClient:
         assert client._connected is False
         assert client.socket is None
 
-    @pytest.mark.asyncio
+    async def test_get_returns_shared_client(self, monkeypatch):
+        """Test that clients are shared per host and port."""
+        monkeypatch.setattr("seestar_mcp.telescope_client._clients", {})
+
+        first = await SeestarClient.get("192.168.1.200", 4700)
+        second = await SeestarClient.get("192.168.1.200", 4700, timeout=10.0)
+        other = await SeestarClient.get("192.168.1.200", 4701)
+
+        assert first is second
+        assert first.timeout == 10.0
+        assert other is not first
+        assert other.port == 4701
+
+    async def test_reconnect_leaves_one_reader_thread(self, monkeypatch):
+        """Test that disconnecting and reconnecting a shared client stops its old reader."""
+        monkeypatch.setattr("seestar_mcp.telescope_client._clients", {})
+        client = await SeestarClient.get("192.168.1.200", 4700)
+        sockets = [_blocking_socket(client), _blocking_socket(client)]
+
+        with (
+            patch("socket.socket", side_effect=sockets),
+            patch.object(client, "_send_udp_handshake", new_callable=AsyncMock),
+        ):
+            assert await client.connect() is True
+            first_thread = client._message_thread
+            await client.disconnect()
+
+            client = await SeestarClient.get("192.168.1.200", 4700)
+            assert await client.connect() is True
+
+        second_thread = client._message_thread
+        try:
+            assert not first_thread.is_alive()
+            assert second_thread.is_alive()
+            assert client.socket is sockets[1]
+            sockets[1].close.assert_not_called()
+        finally:
+            await client.disconnect()
+        assert not second_thread.is_alive()
+
+    async def test_connect_stops_reader_mid_reconnect(self, monkeypatch):
+        """Test that connect() waits out a reader that is still reconnecting."""
+        monkeypatch.setattr("seestar_mcp.telescope_client._clients", {})
+        client = await SeestarClient.get("192.168.1.200", 4700)
+        first, fresh = _blocking_socket(client), _blocking_socket(client)
+
+        # The telescope drops the first connection: the reader's recv() keeps
+        # timing out, and its reconnect hangs in connect() until released
+        dropped = threading.Event()
+
+        def recv(bufsize):
+            dropped.wait(5.0)
+            raise socket.timeout
+
+        first.recv.side_effect = recv
+        stale = _FakeSocket()
+        reconnecting = threading.Event()
+        released = threading.Event()
+        stale.connect.side_effect = lambda address: (
+            reconnecting.set(),
+            released.wait(5.0),
+        )
+
+        with (
+            patch("socket.socket", side_effect=[first, stale, fresh]),
+            patch.object(client, "_send_udp_handshake", new_callable=AsyncMock),
+        ):
+            assert await client.connect() is True
+            old_thread = client._message_thread
+            client._connected = False
+            dropped.set()
+            assert await asyncio.to_thread(reconnecting.wait, 5.0)
+
+            asyncio.get_running_loop().call_later(0.05, released.set)
+            assert await client.connect() is True
+
+        try:
+            assert not old_thread.is_alive()
+            assert client._message_thread.is_alive()
+            assert client.socket is fresh
+            stale.close.assert_called_once()
+            fresh.close.assert_not_called()
+        finally:
+            await client.disconnect()
+
     async def test_connect_success(self, client, mock_socket):
         """Test successful connection."""
-        with patch("socket.socket", return_value=mock_socket):
-            with patch.object(client, "_send_udp_handshake", new_callable=AsyncMock):
-                with patch("threading.Thread") as mock_thread:
-                    mock_socket.connect = Mock()  # Successful connection
-                    mock_thread_instance = Mock()
-                    mock_thread.return_value = mock_thread_instance
+        with (
+            patch("socket.socket", return_value=mock_socket),
+            patch.object(client, "_send_udp_handshake", new_callable=AsyncMock),
+            patch("seestar_mcp.telescope_client.Thread") as mock_thread,
+        ):
+            mock_socket.connect = Mock()  # Successful connection
+            mock_socket.sendall.side_effect = _ack_frames(client)
+            mock_thread_instance = Mock()
+            mock_thread.return_value = mock_thread_instance
 
-                    success = await client.connect()
+            success = await client.connect()
 
-                    assert success is True
-                    assert client._connected is True
-                    assert client.socket is mock_socket
-                    mock_socket.connect.assert_called_once_with(("192.168.1.100", 4700))
+            assert success is True
+            assert client._connected is True
+            assert client.socket is mock_socket
+            mock_socket.connect.assert_called_once_with(("192.168.1.100", 4700))
+            mock_socket.setsockopt.assert_any_call(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20
+            )
+            mock_socket.setsockopt.assert_any_call(
+                socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
+            )
 
-    @pytest.mark.asyncio
     async def test_connect_failure(self, client, mock_socket):
         """Test connection failure."""
         with patch("socket.socket", return_value=mock_socket):
@@ -73,7 +250,6 @@ class TestSeestarClient:
             assert success is False
             assert client._connected is False
 
-    @pytest.mark.asyncio
     async def test_disconnect(self, client, mock_socket):
         """Test disconnection."""
         client.socket = mock_socket
@@ -86,13 +262,11 @@ class TestSeestarClient:
         assert client._is_watch_events is False
         mock_socket.close.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_status_not_connected(self, client):
         """Test getting status when not connected."""
         status = await client.get_status()
         assert status is None
 
-    @pytest.mark.asyncio
     async def test_get_status_connected(self, client, mock_socket):
         """Test getting telescope status when connected."""
         client.socket = mock_socket
@@ -107,79 +281,274 @@ class TestSeestarClient:
             # The method returns a default status when no real data available
             assert status is not None
             assert hasattr(status, "status")
+            assert status.last_updated is None
+
+    async def test_get_status_merges_reply(self, client, mock_socket):
+        """Test that get_status returns the position from the telescope's reply."""
+        client.socket = mock_socket
+        client._connected = True
+
+        def reply(data):
+            frame = json.loads(data.decode("utf-8"))
+            client._handle_message(
+                {"id": frame["id"], "code": 0, "result": {"ra": 10.5, "dec": 41.2}}
+            )
+
+        mock_socket.sendall.side_effect = reply
+
+        status = await client.get_status()
+
+        assert status.ra == 10.5
+        assert status.dec == 41.2
+        assert status.last_updated is not None
+        assert client._pending == {}
+
+    async def test_wait_for_response_from_message_thread(self, client, mock_socket):
+        """Test that a reply received on the message thread wakes the waiter."""
+        client.socket = mock_socket
+        client._connected = True
+
+        cmdid = client._json_message("get_view_state", expect_reply=True)
+        reply = {"id": cmdid, "code": 0, "result": {"state": "idle"}}
+        thread = threading.Thread(target=client._handle_message, args=(reply,))
+        thread.start()
+
+        response = await client._wait_for_response(cmdid, 5.0)
+        thread.join()
+
+        assert response == reply
+        assert cmdid not in client._pending
+
+    async def test_wait_for_response_timeout(self, client, mock_socket):
+        """Test that a missing reply times out and is forgotten."""
+        client.socket = mock_socket
+        client._connected = True
+
+        cmdid = client._json_message("get_view_state", expect_reply=True)
+        response = await client._wait_for_response(cmdid, 0.01)
+
+        assert response is None
+        assert cmdid not in client._pending
+
+    async def test_unawaited_command_registers_no_reply(self, client, mock_socket):
+        """Test that fire-and-forget commands leave no pending reply behind."""
+        client.socket = mock_socket
+        client._connected = True
+
+        client._json_message("iscope_stop_view", {"stage": "All"})
+        client._json_message_batch([("start_scan_planet", None)])
+
+        assert client._pending == {}
+
+    def test_is_solar_target(self):
+        """Test solar system target detection."""
+        assert SeestarClient._is_solar_target("Mars")
+        assert SeestarClient._is_solar_target("the Sun")
+        assert SeestarClient._is_solar_target("JUPITER")
+        assert not SeestarClient._is_solar_target("M31")
+        assert not SeestarClient._is_solar_target("Sunflower Galaxy")
+
+    async def test_start_solar_observation_single_write(self, client, mock_socket):
+        """Test that the solar start sequence is sent in one write."""
+        client.socket = mock_socket
+        client._connected = True
+
+        def reply(data):
+            for line in data.decode("utf-8").split("\r\n")[:-1]:
+                client._handle_message({"id": json.loads(line)["id"], "code": 0})
+
+        mock_socket.sendall.side_effect = reply
+
+        result = await client.start_solar_observation("Sun")
+
+        assert result["success"] is True
+        mock_socket.sendall.assert_called_once()
+        frames = mock_socket.sendall.call_args[0][0].decode("utf-8").split("\r\n")
+        assert [json.loads(f)["method"] for f in frames[:-1]] == [
+            "iscope_start_view",
+            "start_scan_planet",
+            "clear_app_state",
+        ]
+        assert client._pending == {}
+
+    async def test_snapshot_runs_probes_concurrently(self, client, mock_socket):
+        """Test that snapshot sends every probe before any reply arrives."""
+        client.socket = mock_socket
+        client._connected = True
+
+        result = await asyncio.wait_for(client.snapshot(), 1.5)
+
+        assert set(result) == {
+            "device_state",
+            "station_state",
+            "view_state",
+            "stack_setting",
+            "wheel_state",
+            "focuser_position",
+        }
+        assert result["focuser_position"] == 5000
+        assert mock_socket.sendall.call_count == 6
+        if hasattr(socket, "TCP_CORK"):
+            assert mock_socket.setsockopt.call_args_list == [
+                call(socket.IPPROTO_TCP, socket.TCP_CORK, 1),
+                call(socket.IPPROTO_TCP, socket.TCP_CORK, 0),
+            ]
+
+    async def test_snapshot_maps_failed_and_slow_probes_to_none(
+        self, client, mock_socket
+    ):
+        """Test that snapshot reports probes that raise or time out as None."""
+        client.socket = mock_socket
+        client._connected = True
+        client.timeout = 0.05
+        mock_socket.sendall.side_effect = _ack_frames(client)
+        hang = asyncio.Event()
+
+        with (
+            patch.object(
+                client, "get_view_state", AsyncMock(side_effect=RuntimeError("boom"))
+            ),
+            patch.object(client, "get_wheel_state", AsyncMock(side_effect=hang.wait)),
+        ):
+            result = await client.snapshot()
+
+        assert result["view_state"] is None
+        assert result["wheel_state"] is None
+        assert result["focuser_position"] == 5000
+
+    async def test_set_focuser_position_waits_for_move(self, client, mock_socket):
+        """Test that a focuser move finishes when its completion event arrives."""
+        client.socket = mock_socket
+        client._connected = True
+        event = {"Event": "FocuserMove", "state": "complete", "position": 1500}
+        mock_socket.sendall.side_effect = lambda _data: threading.Thread(
+            target=client._handle_message, args=(event,)
+        ).start()
+
+        result = await client.set_focuser_position(1500)
+
+        assert result is True
+        assert client._move_waiters == {}
+
+    async def test_set_wheel_position_move_failed(self, client, mock_socket):
+        """Test that a failed filter wheel move is reported."""
+        client.socket = mock_socket
+        client._connected = True
+        mock_socket.sendall.side_effect = lambda _data: client._handle_message(
+            {"Event": "WheelMove", "state": "fail", "error": "jammed"}
+        )
+
+        result = await client.set_wheel_position(2)
+
+        assert result is False
+        assert client._move_waiters == {}
+
+    async def test_set_wheel_position_without_event(self, caplog, client, mock_socket):
+        """Test that a filter wheel move without a completion event counts as sent."""
+        client.socket = mock_socket
+        client._connected = True
+        client.timeout = 0.01
+
+        with caplog.at_level("WARNING", logger="seestar_mcp.telescope_client"):
+            result = await client.set_wheel_position(2)
+
+        assert result is True
+        mock_socket.sendall.assert_called_once()
+        assert client._move_waiters == {}
+        assert "No WheelMove event within 0.01s" in caplog.text
+
+    async def test_get_comprehensive_state_shared_result(self, client, mock_socket):
+        """Test that the constant success result is shared and read-only."""
+        client.socket = mock_socket
+        client._connected = True
+
+        with patch.object(client, "_wait_for_response", AsyncMock()):
+            first = await client.get_comprehensive_state()
+            second = await client.get_comprehensive_state()
+
+        assert first is second
+        assert first["success"] is True
+        with pytest.raises(TypeError):
+            first["success"] = False
 
-    @pytest.mark.asyncio
     async def test_goto_coordinates_not_connected(self, client):
         """Test goto when not connected."""
-        coordinates = Coordinates(ra=12.5, dec=35.7, epoch="J2000")
-
         with pytest.raises(RuntimeError, match="Not connected to telescope"):
-            await client.goto_coordinates(coordinates)
+            await client.goto_coordinates(_COORDS_J2000)
 
     async def test_goto_coordinates_connected(self):
         """Test goto_coordinates with connection established"""
         client = SeestarClient("192.168.1.100", 4700)
         client._connected = True
 
-        coordinates = Coordinates(ra=12.5, dec=35.7)
-
         # Mock the entire method to avoid the hanging loop
         with patch.object(client, "goto_coordinates", return_value=True):
-            result = await client.goto_coordinates(coordinates)
+            result = await client.goto_coordinates(_COORDS_J2000)
             assert result is True
 
-    @pytest.mark.asyncio
+    async def test_goto_coordinates_failure_message(self, client, mock_socket):
+        """Test goto failure without error details reports an unknown error."""
+        client.socket = mock_socket
+        client._connected = True
+        client._last_error_details = None
+
+        def fail_goto(method, params=None):
+            if method == "scope_get_equ_coord":
+                client._op_state = "failed"
+
+        with (
+            patch.object(client, "_json_message", side_effect=fail_goto),
+            patch("asyncio.sleep", _instant_sleep),
+        ):
+            with pytest.raises(RuntimeError, match="failed: Unknown error"):
+                await client.goto_coordinates(_COORDS_J2000, target_name="M31")
+
     async def test_start_imaging_not_connected(self, client):
         """Test starting imaging when not connected."""
-        params = ImagingParams(exposure_time=120.0, count=10, gain=100, binning=1)
-
-        result = await client.start_imaging(params)
+        result = await client.start_imaging(_IMAGING_PARAMS)
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_start_imaging_connected(self, client, mock_socket):
         """Test starting imaging when connected."""
         client.socket = mock_socket
         client._connected = True
 
-        params = ImagingParams(exposure_time=120.0, count=10, gain=100, binning=1)
-
-        with patch.object(client, "_json_message") as mock_json:
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                result = await client.start_imaging(params)
+        with (
+            patch.object(client, "_json_message") as mock_json,
+            patch("asyncio.sleep", _instant_sleep),
+        ):
+            result = await client.start_imaging(_IMAGING_PARAMS)
 
-                mock_json.assert_called()
-                # Expect True since _json_message is mocked and no exception occurs
-                assert result is True
+            mock_json.assert_called()
+            # Expect True since _json_message is mocked and no exception occurs
+            assert result is True
 
-    @pytest.mark.asyncio
     async def test_stop_imaging_not_connected(self, client):
         """Test stopping imaging when not connected."""
         result = await client.stop_imaging()
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_stop_imaging_connected(self, client, mock_socket):
         """Test stopping imaging when connected."""
         client.socket = mock_socket
         client._connected = True
 
-        with patch.object(client, "_json_message") as mock_json:
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                result = await client.stop_imaging()
+        with (
+            patch.object(client, "_json_message") as mock_json,
+            patch("asyncio.sleep", _instant_sleep),
+        ):
+            result = await client.stop_imaging()
 
-                mock_json.assert_called()
-                # Expect True since _json_message is mocked and no exception occurs
-                assert result is True
+            mock_json.assert_called()
+            # Expect True since _json_message is mocked and no exception occurs
+            assert result is True
 
-    @pytest.mark.asyncio
     async def test_get_imaging_status_not_connected(self, client):
         """Test getting imaging status when not connected."""
         status = await client.get_imaging_status()
 
         assert status.status == ImagingStatus.STOPPED
 
-    @pytest.mark.asyncio
     async def test_start_calibration_raises_error(self, client):
         """Test that calibration raises error (not supported via TCP)."""
         with pytest.raises(
@@ -188,14 +557,12 @@ class TestSeestarClient:
         ):
             await client.start_calibration()
 
-    @pytest.mark.asyncio
     async def test_get_calibration_status_not_connected(self, client):
         """Test getting calibration status when not connected."""
         status = await client.get_calibration_status()
 
         assert status.status == CalibrationStatus.NOT_STARTED
 
-    @pytest.mark.asyncio
     async def test_park_telescope_not_connected(self, client):
         """Test parking when not connected."""
         result = await client.park_telescope()
@@ -203,7 +570,6 @@ class TestSeestarClient:
         assert result["success"] is False
         assert "Not connected" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_unpark_telescope_not_connected(self, client):
         """Test unparking when not connected."""
         result = await client.unpark_telescope()
@@ -211,25 +577,26 @@ class TestSeestarClient:
         assert result["success"] is False
         assert "Not connected" in result["error"]
 
-    @pytest.mark.asyncio
     async def test_emergency_stop_not_connected(self, client):
         """Test emergency stop when not connected."""
         result = await client.emergency_stop()
         assert result is False
 
-    @pytest.mark.asyncio
     async def test_emergency_stop_connected(self, client, mock_socket):
         """Test emergency stop when connected."""
         client.socket = mock_socket
         client._connected = True
 
-        with patch.object(client, "_json_message") as mock_json:
-            with patch("asyncio.sleep", new_callable=AsyncMock):
-                result = await client.emergency_stop()
+        with (
+            patch.object(client, "_json_message") as mock_json,
+            patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            result = await client.emergency_stop()
 
-                mock_json.assert_called()
-                # Expect True since _json_message is mocked and no exception occurs
-                assert result is True
+            mock_json.assert_called()
+            mock_sleep.assert_awaited_once_with(0)
+            # Expect True since _json_message is mocked and no exception occurs
+            assert result is True
 
     def test_get_cmdid(self, client):
         """Test command ID generation."""
@@ -239,24 +606,22 @@ class TestSeestarClient:
         assert id2 == id1 + 1
         assert id1 > 1000
 
-    @pytest.mark.asyncio
-    async def test_send_message_not_connected(self, client):
+    def test_send_message_not_connected(self, client):
         """Test sending message when not connected."""
         with pytest.raises(RuntimeError, match="Not connected to telescope"):
             client._send_message("test message")
 
-    @pytest.mark.asyncio
-    async def test_send_message_connected(self, client, mock_socket):
+    def test_send_message_connected(self, client, mock_socket):
         """Test sending message when connected."""
         client.socket = mock_socket
         client._connected = True
 
         client._send_message("test message")
 
-        mock_socket.sendall.assert_called_once_with(b"test message")
+        assert mock_socket.sendall.call_count == 1
+        assert mock_socket.sendall.call_args == _EXPECTED_SEND
 
-    @pytest.mark.asyncio
-    async def test_send_message_socket_error(self, client, mock_socket):
+    def test_send_message_socket_error(self, client, mock_socket):
         """Test handling socket error during send."""
         client.socket = mock_socket
         client._connected = True
@@ -267,28 +632,114 @@ class TestSeestarClient:
 
         assert client._connected is False
 
-    def test_is_connected_property(self, client):
+    def test_json_message_frame_encoding(self, client, mock_socket):
+        """Test that cached command frames match a plain orjson encoding."""
+        client.socket = mock_socket
+        client._connected = True
+
+        cases = [
+            ("scope_move_to_horizon", None),
+            ("iscope_stop_view", {"stage": "All"}),
+            ("scope_park", {"equ_mode": False}),
+            ("get_device_state", {"keys": ["balance_sensor", "compass_sensor"]}),
+        ]
+        for method, params in cases * 2:
+            cmdid = client._json_message(method, params)
+            expected = {"id": cmdid, "method": method}
+            if params:
+                expected["params"] = params
+            sent = mock_socket.sendall.call_args[0][0]
+            assert sent == orjson.dumps(expected) + b"\r\n"
+
+        client._json_message("scope_park", {"equ_mode": 0})
+        assert b'"equ_mode":0' in mock_socket.sendall.call_args[0][0]
+
+        # Equal tuples holding different types must not share a cache entry
+        for value, encoded in [
+            ((True,), b"[true]"),
+            ((1,), b"[1]"),
+            ((1.0,), b"[1.0]"),
+        ]:
+            client._json_message("set_setting", {"values": value})
+            assert b'"values":%s' % encoded in mock_socket.sendall.call_args[0][0]
+
+    def test_message_thread_dispatches_and_detects_eof(self, client, mock_socket):
+        """Test that the message thread handles frames and treats EOF as a disconnect."""
+        client.socket = mock_socket
+        client._connected = True
+        client._is_watch_events = True
+        mock_socket.gettimeout.return_value = 30.0
+        mock_socket.recv.side_effect = [
+            b'{"id": 1, "code": 0}\r\nnot json\r\n{"Event": "Pi',
+            b'Station", "temp": "20\xc2',
+            b'\xb0C"}\r\n',
+            b"",
+        ]
+
+        stop = threading.Event()
+
+        with (
+            patch.object(client, "_handle_message") as mock_handle,
+            patch.object(stop, "wait", side_effect=lambda _delay: stop.set()),
+        ):
+            client._message_thread_fn(stop)
+
+        assert mock_handle.call_args_list == [
+            call({"id": 1, "code": 0}),
+            call({"Event": "PiStation", "temp": "20\u00b0C"}),
+        ]
+        assert client._connected is False
+
+    def test_message_thread_skips_non_object_frames(self, client, mock_socket):
+        """Test that valid JSON frames which are not objects are ignored."""
+        client.socket = mock_socket
+        client._connected = True
+        stop = threading.Event()
+
+        reads = iter([b'[]\r\n42\r\n"text"\r\n{"id": 7, "code": 0}\r\n'])
+
+        def recv(_bufsize):
+            # Deliver the frames, then stop the thread on the next read
+            data = next(reads, None)
+            if data is None:
+                stop.set()
+                raise socket.timeout
+            return data
+
+        mock_socket.recv.side_effect = recv
+
+        with patch.object(
+            client, "_handle_message", wraps=client._handle_message
+        ) as mock_handle:
+            client._message_thread_fn(stop)
+
+        mock_handle.assert_called_once_with({"id": 7, "code": 0})
+        assert client._connected is True
+
+    def test_is_connected_property(self, client, mock_socket):
         """Test is_connected property."""
         assert client.is_connected is False
 
         # Need both _connected=True and socket to be not None
         client._connected = True
-        client.socket = Mock()  # Mock socket object
+        client.socket = mock_socket
         assert client.is_connected is True
 
-    @pytest.mark.asyncio
     async def test_context_manager(self, client, mock_socket):
         """Test async context manager."""
-        with patch("socket.socket", return_value=mock_socket):
-            with patch.object(client, "_send_udp_handshake", new_callable=AsyncMock):
-                with patch("threading.Thread") as mock_thread:
-                    mock_socket.connect = Mock()  # Successful connection
-                    mock_thread_instance = Mock()
-                    mock_thread.return_value = mock_thread_instance
-
-                    async with client as ctx_client:
-                        assert ctx_client is client
-                        assert client._connected is True
-
-                    # Should disconnect on exit
-                    assert client._connected is False
+        with (
+            patch("socket.socket", return_value=mock_socket),
+            patch.object(client, "_send_udp_handshake", new_callable=AsyncMock),
+            patch("seestar_mcp.telescope_client.Thread") as mock_thread,
+        ):
+            mock_socket.connect = Mock()  # Successful connection
+            mock_socket.sendall.side_effect = _ack_frames(client)
+            mock_thread_instance = Mock()
+            mock_thread.return_value = mock_thread_instance
+
+            async with client as ctx_client:
+                assert ctx_client is client
+                assert client._connected is True
+
+            # Should disconnect on exit
+            assert client._connected is False